@@ -14,6 +14,7 @@ Environment Variables:
     SCRAPER_DELAY: Delay between scraping requests in seconds
     SCRAPER_USER_AGENT: Custom user agent string for scraping
     SCRAPER_MAX_RETRIES: Maximum number of retry attempts for scraping
+    SCRAPER_MAX_WORKERS: Maximum number of keywords scraped concurrently
 
 Example:
     >>> from config import get_config
@@ -24,6 +25,7 @@ Example:
 
 import os
 import logging
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -45,6 +47,7 @@ class AppConfig:
         SCRAPER_DELAY: Delay between scraping requests in seconds
         SCRAPER_USER_AGENT: Custom user agent string for scraping
         SCRAPER_MAX_RETRIES: Maximum number of retry attempts for scraping
+        SCRAPER_MAX_WORKERS: Maximum number of keywords scraped concurrently
     """
 
     SERVICE_ACCOUNT_PATH: Optional[str] = None
@@ -55,48 +58,54 @@ class AppConfig:
     SCRAPER_DELAY: float = 1.0
     SCRAPER_USER_AGENT: Optional[str] = None
     SCRAPER_MAX_RETRIES: int = 3
+    SCRAPER_MAX_WORKERS: int = 4
 
 
-# Global configuration instance
-_config: Optional[AppConfig] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """Get the application configuration.
 
     Loads configuration from environment variables with fallbacks to
-    default values. Uses a singleton pattern to ensure configuration
-    is only loaded once.
+    default values. The result is memoized so configuration is only
+    loaded once; call ``get_config.cache_clear()`` to force a reload.
 
     Returns:
         AppConfig: Application configuration object with all settings.
     """
-    global _config
-
-    if _config is None:
-        # Create new configuration with environment variable overrides
-        _config = AppConfig(
-            SERVICE_ACCOUNT_PATH=get_service_account_path(),
-            SHEET_ID=os.getenv("GOOGLE_SHEET_ID", AppConfig.SHEET_ID),
-            MAX_RESULTS=int(os.getenv("MAX_RESULTS", str(AppConfig.MAX_RESULTS))),
-            LOG_LEVEL=os.getenv("LOG_LEVEL", AppConfig.LOG_LEVEL),
-            DATA_DIR=Path(os.getenv("DATA_DIR", str(AppConfig.DATA_DIR))),
-            SCRAPER_DELAY=float(
-                os.getenv("SCRAPER_DELAY", str(AppConfig.SCRAPER_DELAY))
-            ),
-            SCRAPER_USER_AGENT=os.getenv("SCRAPER_USER_AGENT"),
-            SCRAPER_MAX_RETRIES=int(
-                os.getenv("SCRAPER_MAX_RETRIES", str(AppConfig.SCRAPER_MAX_RETRIES))
-            ),
-        )
-
-        # Create data directory if it doesn't exist
-        if not _config.DATA_DIR.exists():
-            _config.DATA_DIR.mkdir(parents=True, exist_ok=True)
-
-    return _config
-
-
+    # Read each environment variable exactly once
+    sheet_id = os.getenv("GOOGLE_SHEET_ID", AppConfig.SHEET_ID)
+    max_results = os.getenv("MAX_RESULTS", str(AppConfig.MAX_RESULTS))
+    log_level = os.getenv("LOG_LEVEL", AppConfig.LOG_LEVEL)
+    data_dir = os.getenv("DATA_DIR", str(AppConfig.DATA_DIR))
+    scraper_delay = os.getenv("SCRAPER_DELAY", str(AppConfig.SCRAPER_DELAY))
+    scraper_user_agent = os.getenv("SCRAPER_USER_AGENT")
+    scraper_max_retries = os.getenv(
+        "SCRAPER_MAX_RETRIES", str(AppConfig.SCRAPER_MAX_RETRIES)
+    )
+    scraper_max_workers = os.getenv(
+        "SCRAPER_MAX_WORKERS", str(AppConfig.SCRAPER_MAX_WORKERS)
+    )
+
+    # Create new configuration with environment variable overrides
+    config = AppConfig(
+        SERVICE_ACCOUNT_PATH=get_service_account_path(),
+        SHEET_ID=sheet_id,
+        MAX_RESULTS=int(max_results),
+        LOG_LEVEL=log_level,
+        DATA_DIR=Path(data_dir),
+        SCRAPER_DELAY=float(scraper_delay),
+        SCRAPER_USER_AGENT=scraper_user_agent,
+        SCRAPER_MAX_RETRIES=int(scraper_max_retries),
+        SCRAPER_MAX_WORKERS=int(scraper_max_workers),
+    )
+
+    # Create data directory if it doesn't exist
+    config.DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    return config
+
+
+@functools.lru_cache(maxsize=1)
 def get_service_account_path() -> Optional[str]:
     """Get the service account JSON file path.
 
@@ -104,19 +113,21 @@ def get_service_account_path() -> Optional[str]:
     1. GOOGLE_SERVICE_ACCOUNT_PATH environment variable
     2. Default location in the project root (service_account.json)
 
+    The lookup is memoized; call ``get_service_account_path.cache_clear()``
+    after moving or creating the credentials file.
+
     Returns:
         Optional[str]: Path to the service account credentials file,
             or None if not found.
     """
-    # First try environment variable
-    env_path = os.getenv("GOOGLE_SERVICE_ACCOUNT_PATH")
-    if env_path and os.path.exists(env_path):
-        return env_path
-
-    # Fallback to default location
-    default_path = "service_account.json"
-    if os.path.exists(default_path):
-        return default_path
+    # Environment variable first, then the default location
+    candidates = (os.getenv("GOOGLE_SERVICE_ACCOUNT_PATH"), "service_account.json")
+    for path in filter(None, candidates):
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        return path
 
     # If neither exists, return None
     return None
@@ -143,6 +154,7 @@ def validate_credentials() -> bool:
     Returns:
         bool: True if credentials are valid, False otherwise.
     """
+    # get_service_account_path only returns paths that exist
     service_account_path = get_service_account_path()
     if not service_account_path:
         print("❌ No service account credentials found!")
@@ -150,10 +162,6 @@ def validate_credentials() -> bool:
         print("or place your service account JSON file as 'service_account.json'")
         return False
 
-    if not os.path.exists(service_account_path):
-        print(f"❌ Service account file not found: {service_account_path}")
-        return False
-
     print(f"✅ Service account credentials found: {service_account_path}")
     return True
 
@@ -4,18 +4,53 @@ Handles data storage, querying, and analytics for auction results.
 """
 
 import duckdb
-import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import (
+    Any,
+    Callable,
+    List,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+import copy
 import os
+import shutil
+import tempfile
 import threading
+import time
 import atexit
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+# Database file used by get_database() and the maintenance scripts
+DEFAULT_DB_PATH = "auction_data.duckdb"
+
 
 class AuctionDatabase:
     """DuckDB database manager for auction data"""
 
-    def __init__(self, db_path: str = "auction_data.duckdb"):
+    # Seconds an aggregate result may be served from cache
+    AGG_CACHE_TTL = 60.0
+
+    # Columns of auction_results that queries may select by name
+    RESULT_COLUMNS = (
+        "keyword",
+        "item_description",
+        "current_price",
+        "auction_end_date",
+        "image_url",
+        "scraped_at",
+        "source_url",
+    )
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
         """
         Initialize the database connection
 
@@ -24,6 +59,8 @@ class AuctionDatabase:
         """
         self.db_path = db_path
         self._lock = threading.Lock()
+        self._local = threading.local()
+        self._agg_cache: Dict[str, Tuple[float, Any, Any]] = {}
         self.conn = None
         self._connect()
         self._create_tables()
@@ -32,77 +69,213 @@ class AuctionDatabase:
         atexit.register(self.close)
 
     def _connect(self):
-        """Create a new database connection with proper settings"""
-        try:
-            # Use read-write mode with better concurrency handling
-            self.conn = duckdb.connect(self.db_path, read_only=False)
-        except Exception as e:
-            print(f"Warning: Could not connect to database: {e}")
-            # Try with different settings or create new file
-            try:
-                # Try with read-only mode first
-                self.conn = duckdb.connect(self.db_path, read_only=True)
-                self.conn.close()
-                # Now try read-write
-                self.conn = duckdb.connect(self.db_path, read_only=False)
-            except:
-                # If all else fails, create a new database file
-                import os
+        """
+        Create a new database connection with proper settings
+
+        Connection errors propagate to the caller; get_database() falls back
+        to a temporary database path if the default file cannot be opened.
+        """
+        self.conn = duckdb.connect(
+            self.db_path,
+            read_only=False,
+            config={"access_mode": "READ_WRITE", "threads": str(os.cpu_count() or 1)},
+        )
+
+    def _get_conn(self):
+        """
+        Get a per-thread cursor connection for read-only queries
+
+        The root connection is reserved for writes; each thread lazily creates
+        and reuses its own cursor off the shared database so reads can run
+        concurrently without contending on the write lock.
+
+        Returns:
+            duckdb.DuckDBPyConnection: Cursor connection for the calling thread
+        """
+        local = self._local
+        if getattr(local, "root", None) is not self.conn:
+            local.cursor = self.conn.cursor()
+            local.root = self.conn
+        return local.cursor
+
+    @staticmethod
+    def _to_frame(
+        result: duckdb.DuckDBPyConnection, as_arrow: bool
+    ) -> Union["pd.DataFrame", "pa.Table"]:
+        """
+        Materialize a query result as a pandas DataFrame or an Arrow table
+
+        Args:
+            result (duckdb.DuckDBPyConnection): Executed query
+            as_arrow (bool): Return a pyarrow.Table instead of a DataFrame
+
+        Returns:
+            Union[pd.DataFrame, pa.Table]: Query results
+        """
+        if not as_arrow:
+            return result.df()
+        # to_arrow_table replaces the deprecated fetch_arrow_table in newer
+        # DuckDB releases; older ones (such as the pinned 0.9) only have the
+        # latter, and arrow() now returns a reader rather than a table
+        to_arrow_table = getattr(result, "to_arrow_table", None)
+        if to_arrow_table is None:
+            return result.fetch_arrow_table()
+        return to_arrow_table()
+
+    @classmethod
+    def _select_list(cls, columns: Optional[Sequence[str]]) -> str:
+        """
+        Build the SELECT list for a query on auction_results
+
+        Args:
+            columns (Sequence[str], optional): Columns to select; all if None
+
+        Returns:
+            str: Comma-separated column list, or ``*``
+
+        Raises:
+            ValueError: If a column is not in RESULT_COLUMNS
+        """
+        if columns is None:
+            return "*"
+        unknown = [c for c in columns if c not in cls.RESULT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown auction_results columns: {unknown}")
+        return ", ".join(columns)
+
+    def _cached_agg(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """
+        Return a cached aggregate, recomputing it when stale
 
-                backup_path = f"{self.db_path}.backup"
-                if os.path.exists(self.db_path):
-                    os.rename(self.db_path, backup_path)
-                self.conn = duckdb.connect(self.db_path, read_only=False)
+        An entry is reused while it is younger than ``ttl`` seconds and the
+        latest ``scraped_at`` in auction_results is unchanged. Callers get a
+        copy, so modifying the result never changes the cached entry.
+
+        Args:
+            key (str): Cache key for the aggregate
+            ttl (float): Maximum age of a cached entry in seconds
+            fn (Callable[[], Any]): Computes the aggregate on a cache miss
+
+        Returns:
+            Any: The cached or freshly computed aggregate
+        """
+        probe = (
+            self._get_conn()
+            .execute("SELECT MAX(scraped_at) FROM auction_results")
+            .fetchone()[0]
+        )
+        now = time.monotonic()
+        with self._lock:
+            cached = self._agg_cache.get(key)
+        if cached is not None:
+            cached_at, cached_probe, value = cached
+            if now - cached_at < ttl and cached_probe == probe:
+                return self._copy_agg(value)
+
+        value = fn()
+        with self._lock:
+            self._agg_cache[key] = (now, probe, value)
+        return self._copy_agg(value)
+
+    @staticmethod
+    def _copy_agg(value: Any) -> Any:
+        """
+        Copy a cached aggregate so callers can modify it freely
+
+        Args:
+            value (Any): Cached dict, DataFrame or (immutable) Arrow table
+
+        Returns:
+            Any: A copy of ``value``, or ``value`` itself if it is immutable
+        """
+        if isinstance(value, dict):
+            return copy.deepcopy(value)
+        if hasattr(value, "copy"):
+            return value.copy()
+        return value
 
     def _create_tables(self):
         """Create the necessary tables if they don't exist"""
-        with self._lock:
-            try:
-                # Create auction_results table
-                self.conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS auction_results (
-                        keyword VARCHAR,
-                        item_description TEXT,
-                        current_price DECIMAL(10,2),
-                        auction_end_date DATE,
-                        image_url TEXT,
-                        scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        source_url TEXT
-                    )
+        try:
+            # Submit the whole schema as one multi-statement script
+            self.conn.execute(
                 """
-                )
+                -- Auction results table
+                CREATE TABLE IF NOT EXISTS auction_results (
+                    keyword VARCHAR,
+                    item_description TEXT,
+                    current_price DECIMAL(10,2),
+                    auction_end_date DATE,
+                    image_url TEXT,
+                    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    source_url TEXT
+                );
+
+                -- Index the common filter and ordering columns
+                CREATE INDEX IF NOT EXISTS idx_ar_keyword_time
+                ON auction_results(keyword, scraped_at);
+                CREATE INDEX IF NOT EXISTS idx_ar_scraped_at
+                ON auction_results(scraped_at);
+                CREATE INDEX IF NOT EXISTS idx_ar_price
+                ON auction_results(current_price);
+
+                -- Keywords table for tracking
+                CREATE SEQUENCE IF NOT EXISTS keywords_id_seq;
+                CREATE TABLE IF NOT EXISTS keywords (
+                    id INTEGER PRIMARY KEY DEFAULT nextval('keywords_id_seq'),
+                    keyword VARCHAR UNIQUE,
+                    last_scraped TIMESTAMP,
+                    total_results INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                -- Scraping sessions table for analytics
+                CREATE TABLE IF NOT EXISTS scraping_sessions (
+                    id INTEGER PRIMARY KEY,
+                    session_start TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    session_end TIMESTAMP,
+                    keywords_processed INTEGER DEFAULT 0,
+                    total_results INTEGER DEFAULT 0,
+                    status VARCHAR DEFAULT 'running'
+                );
+            """
+            )
+            self._migrate_keywords_id()
 
-                # Create keywords table for tracking
-                self.conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS keywords (
-                        id INTEGER PRIMARY KEY,
-                        keyword VARCHAR UNIQUE,
-                        last_scraped TIMESTAMP,
-                        total_results INTEGER DEFAULT 0,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                )
+            self.conn.commit()
+        except Exception as e:
+            print(f"Warning: Could not create tables: {e}")
 
-                # Create scraping_sessions table for analytics
-                self.conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS scraping_sessions (
-                        id INTEGER PRIMARY KEY,
-                        session_start TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        session_end TIMESTAMP,
-                        keywords_processed INTEGER DEFAULT 0,
-                        total_results INTEGER DEFAULT 0,
-                        status VARCHAR DEFAULT 'running'
-                    )
-                """
-                )
+    def _migrate_keywords_id(self):
+        """
+        Give keywords.id its sequence default in databases that predate it
 
-                self.conn.commit()
-            except Exception as e:
-                print(f"Warning: Could not create tables: {e}")
+        CREATE TABLE IF NOT EXISTS leaves an existing keywords table as it
+        was, with a plain ``id INTEGER PRIMARY KEY`` and no default, so the
+        keyword upsert (which omits id) would fail its NOT NULL constraint.
+        The sequence is restarted past any existing id before it is attached.
+        """
+        id_default = self.conn.execute(
+            """
+            SELECT column_default FROM information_schema.columns
+            WHERE table_name = 'keywords' AND column_name = 'id'
+        """
+        ).fetchone()[0]
+        if id_default is not None:
+            return
+
+        next_id = self.conn.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM keywords"
+        ).fetchone()[0]
+        self.conn.execute(
+            f"CREATE OR REPLACE SEQUENCE keywords_id_seq START {int(next_id)}"
+        )
+        self.conn.execute(
+            """
+            ALTER TABLE keywords
+            ALTER COLUMN id SET DEFAULT nextval('keywords_id_seq')
+        """
+        )
 
     def insert_auction_results(self, keyword: str, results: List[Dict]) -> int:
         """
@@ -114,98 +287,124 @@ class AuctionDatabase:
 
         Returns:
             int: Number of results inserted
+
+        Raises:
+            duckdb.Error: If the insert fails; nothing is saved
+        """
+        return self.insert_auction_results_bulk([(keyword, results)])
+
+    def insert_auction_results_bulk(
+        self, pending_inserts: List[Tuple[str, List[Dict]]]
+    ) -> int:
+        """
+        Insert results for several keywords in a single transaction
+
+        Behaves like calling insert_auction_results() once per keyword, but
+        all rows go in with one INSERT and the transaction is committed once.
+        If either the rows or the keyword upsert fail, the whole transaction
+        is rolled back and the error is raised.
+
+        Args:
+            pending_inserts (List[Tuple[str, List[Dict]]]): (keyword, results)
+                pairs to insert
+
+        Returns:
+            int: Number of results inserted
+
+        Raises:
+            duckdb.Error: If the insert fails; nothing is saved
         """
-        if not results:
+        pending_inserts = [(kw, results) for kw, results in pending_inserts if results]
+        if not pending_inserts:
             return 0
 
+        import pandas as pd
+
+        rows = [(kw, r) for kw, results in pending_inserts for r in results]
+
+        # Build the DataFrame directly in the database schema
+        df_to_insert = pd.DataFrame(
+            {
+                "keyword": [kw for kw, _ in rows],
+                "item_description": [r.get("Item Description") for _, r in rows],
+                "current_price": [r.get("Current price") for _, r in rows],
+                "auction_end_date": [r.get("Auction end date") for _, r in rows],
+                "image_url": [
+                    r.get("Auction image / thumbnail URL (extra credit)")
+                    for _, r in rows
+                ],
+                "scraped_at": datetime.now(),
+            }
+        )
+
+        # Clean price data in a single regex pass; numeric prices skip it
+        prices = df_to_insert["current_price"]
+        if not pd.api.types.is_numeric_dtype(prices):
+            prices = prices.str.replace(r"[$,]", "", regex=True)
+        df_to_insert["current_price"] = pd.to_numeric(prices, errors="coerce")
+
+        # Parse dates once into datetime64; the insert casts the typed
+        # column to DATE in bulk (unparseable dates become NULL)
+        df_to_insert["auction_end_date"] = pd.to_datetime(
+            df_to_insert["auction_end_date"], format="mixed", errors="coerce"
+        )
+
         with self._lock:
             try:
-                # Convert results to DataFrame
-                df = pd.DataFrame(results)
-
-                # Add keyword column
-                df["keyword"] = keyword
-                df["scraped_at"] = datetime.now()
-
-                # Rename columns to match database schema
-                column_mapping = {
-                    "Item Description": "item_description",
-                    "Current price": "current_price",
-                    "Auction end date": "auction_end_date",
-                    "Auction image / thumbnail URL (extra credit)": "image_url",
-                }
-                df = df.rename(columns=column_mapping)
-
-                # Select only the columns we need
-                columns_to_insert = [
-                    "keyword",
-                    "item_description",
-                    "current_price",
-                    "auction_end_date",
-                    "image_url",
-                    "scraped_at",
-                ]
-
-                df_to_insert = df[columns_to_insert].copy()
-
-                # Clean price data
-                df_to_insert["current_price"] = pd.to_numeric(
-                    df_to_insert["current_price"]
-                    .str.replace("$", "")
-                    .str.replace(",", ""),
-                    errors="coerce",
-                )
+                # Insert results and update keyword tracking in one transaction
+                self.conn.begin()
 
-                # Insert into database using proper DuckDB syntax
-                for _, row in df_to_insert.iterrows():
+                # Bulk insert all rows in one statement via DataFrame registration
+                self.conn.register("df_to_insert", df_to_insert)
+                try:
                     self.conn.execute(
                         """
-                        INSERT INTO auction_results 
+                        INSERT INTO auction_results
                         (keyword, item_description, current_price, auction_end_date, image_url, scraped_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                        [
-                            str(row["keyword"]),
-                            str(row["item_description"]),
-                            (
-                                float(row["current_price"])
-                                if pd.notna(row["current_price"])
-                                else None
-                            ),
-                            (
-                                str(row["auction_end_date"])
-                                if pd.notna(row["auction_end_date"])
-                                else None
-                            ),
-                            (
-                                str(row["image_url"])
-                                if pd.notna(row["image_url"])
-                                else None
-                            ),
-                            str(row["scraped_at"]),
-                        ],
+                        SELECT
+                            keyword,
+                            item_description,
+                            current_price,
+                            CAST(auction_end_date AS DATE),
+                            image_url,
+                            scraped_at
+                        FROM df_to_insert
+                    """
                     )
-                self.conn.commit()
+                finally:
+                    self.conn.unregister("df_to_insert")
 
-                # Update keywords table
-                self.conn.execute(
+                # Update keywords table in place, accumulating result counts
+                now = datetime.now()
+                self.conn.executemany(
                     """
-                    INSERT OR REPLACE INTO keywords (keyword, last_scraped, total_results)
+                    INSERT INTO keywords (keyword, last_scraped, total_results)
                     VALUES (?, ?, ?)
+                    ON CONFLICT (keyword) DO UPDATE SET
+                        last_scraped = EXCLUDED.last_scraped,
+                        total_results = keywords.total_results + EXCLUDED.total_results
                 """,
-                    [keyword, datetime.now(), len(results)],
+                    [[kw, now, len(results)] for kw, results in pending_inserts],
                 )
                 self.conn.commit()
-
-                return len(results)
             except Exception as e:
-                print(f"Database save failed for keyword {keyword}: {e}")
-                # Try to reconnect if connection is lost
+                keywords = ", ".join(kw for kw, _ in pending_inserts)
+                print(f"Database save failed for keyword {keywords}: {e}")
+                # Discard the partial transaction so no rows are half-saved
                 try:
-                    self._connect()
-                except:
-                    pass
-                return 0
+                    self.conn.rollback()
+                except Exception:
+                    # Try to reconnect if connection is lost
+                    try:
+                        self._connect()
+                    except Exception:
+                        pass
+                raise
+
+            # Aggregates over auction_results are now stale
+            self._agg_cache.clear()
+
+        return len(rows)
 
     def get_auction_results(
         self,
@@ -213,7 +412,9 @@ class AuctionDatabase:
         limit: Optional[int] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
-    ) -> pd.DataFrame:
+        fuzzy: bool = True,
+        as_arrow: bool = False,
+    ) -> Union["pd.DataFrame", "pa.Table"]:
         """
         Query auction results from the database
 
@@ -222,16 +423,22 @@ class AuctionDatabase:
             limit (int, optional): Limit number of results
             min_price (float, optional): Minimum price filter
             max_price (float, optional): Maximum price filter
+            fuzzy (bool): Match keyword as a case-insensitive substring;
+                set to False for an exact match that can use the keyword index
+            as_arrow (bool): Return a pyarrow.Table instead of a DataFrame
 
         Returns:
-            pd.DataFrame: Query results
+            Union[pd.DataFrame, pa.Table]: Query results
         """
         query = "SELECT * FROM auction_results WHERE 1=1"
         params = []
 
-        if keyword:
+        if keyword and fuzzy:
             query += " AND keyword ILIKE ?"
             params.append(f"%{keyword}%")
+        elif keyword:
+            query += " AND keyword = ?"
+            params.append(keyword)
 
         if min_price is not None:
             query += " AND current_price >= ?"
@@ -244,18 +451,34 @@ class AuctionDatabase:
         query += " ORDER BY scraped_at DESC"
 
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ?"
+            params.append(limit)
 
-        return self.conn.execute(query, params).df()
+        return self._to_frame(self._get_conn().execute(query, params), as_arrow)
 
-    def get_keyword_stats(self) -> pd.DataFrame:
+    def get_keyword_stats(
+        self, as_arrow: bool = False
+    ) -> Union["pd.DataFrame", "pa.Table"]:
         """
         Get statistics for all keywords
 
+        Args:
+            as_arrow (bool): Return a pyarrow.Table instead of a DataFrame
+
         Returns:
-            pd.DataFrame: Keyword statistics
+            Union[pd.DataFrame, pa.Table]: Keyword statistics
         """
-        return self.conn.execute(
+        return self._cached_agg(
+            f"keyword_stats:{as_arrow}",
+            self.AGG_CACHE_TTL,
+            lambda: self._query_keyword_stats(as_arrow),
+        )
+
+    def _query_keyword_stats(
+        self, as_arrow: bool
+    ) -> Union["pd.DataFrame", "pa.Table"]:
+        """Run the keyword statistics aggregate query"""
+        result = self._get_conn().execute(
             """
             SELECT 
                 ar.keyword,
@@ -269,7 +492,8 @@ class AuctionDatabase:
             GROUP BY ar.keyword
             ORDER BY total_items DESC
         """
-        ).df()
+        )
+        return self._to_frame(result, as_arrow)
 
     def get_price_analytics(self) -> Dict:
         """
@@ -278,7 +502,13 @@ class AuctionDatabase:
         Returns:
             Dict: Price analytics
         """
-        result = self.conn.execute(
+        return self._cached_agg(
+            "price_analytics", self.AGG_CACHE_TTL, self._query_price_analytics
+        )
+
+    def _query_price_analytics(self) -> Dict:
+        """Run the price analytics aggregate query"""
+        result = self._get_conn().execute(
             """
             SELECT 
                 COUNT(*) as total_items,
@@ -299,57 +529,105 @@ class AuctionDatabase:
             "median_price": result[4],
         }
 
-    def search_items(self, search_term: str, limit: int = 50) -> pd.DataFrame:
+    def search_items(
+        self,
+        search_term: str,
+        limit: int = 50,
+        as_arrow: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Union["pd.DataFrame", "pa.Table"]:
         """
         Search items by description
 
         Args:
             search_term (str): Search term
             limit (int): Maximum results to return
+            as_arrow (bool): Return a pyarrow.Table instead of a DataFrame
+            columns (Sequence[str], optional): Columns to return; all if None
 
         Returns:
-            pd.DataFrame: Search results
+            Union[pd.DataFrame, pa.Table]: Search results
         """
-        return self.conn.execute(
-            """
-            SELECT * FROM auction_results
+        result = self._get_conn().execute(
+            f"""
+            SELECT {self._select_list(columns)} FROM auction_results
             WHERE item_description ILIKE ?
             ORDER BY scraped_at DESC
             LIMIT ?
         """,
             (f"%{search_term}%", limit),
-        ).df()
+        )
+        return self._to_frame(result, as_arrow)
 
-    def get_recent_results(self, hours: int = 24) -> pd.DataFrame:
+    def get_recent_results(
+        self,
+        hours: int = 24,
+        as_arrow: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Union["pd.DataFrame", "pa.Table"]:
         """
         Get results from the last N hours
 
         Args:
             hours (int): Number of hours to look back
+            as_arrow (bool): Return a pyarrow.Table instead of a DataFrame
+            columns (Sequence[str], optional): Columns to return; all if None
 
         Returns:
-            pd.DataFrame: Recent results
+            Union[pd.DataFrame, pa.Table]: Recent results
         """
-        return self.conn.execute(
-            """
-            SELECT * FROM auction_results
-            WHERE scraped_at >= datetime('now', '-{} hours')
+        result = self._get_conn().execute(
+            f"""
+            SELECT {self._select_list(columns)} FROM auction_results
+            WHERE scraped_at >= CURRENT_TIMESTAMP - INTERVAL (?) HOUR
             ORDER BY scraped_at DESC
-        """.format(
-                hours
-            )
-        ).df()
+        """,
+            [hours],
+        )
+        return self._to_frame(result, as_arrow)
 
     def export_to_csv(self, filepath: str, keyword: Optional[str] = None):
         """
         Export data to CSV
 
+        The export is written by DuckDB's COPY, so rows stream straight to
+        disk without being materialized in Python.
+
         Args:
             filepath (str): Output file path
             keyword (str, optional): Filter by keyword
         """
-        df = self.get_auction_results(keyword=keyword)
-        df.to_csv(filepath, index=False)
+        where = "WHERE keyword ILIKE ?" if keyword else ""
+        params = [f"%{keyword}%"] if keyword else []
+
+        # COPY cannot bind its target as a parameter, so quote it as a literal
+        target = filepath.replace("'", "''")
+        self._get_conn().execute(
+            f"""
+            COPY (
+                SELECT * FROM auction_results {where} ORDER BY scraped_at DESC
+            ) TO '{target}' (HEADER, DELIMITER ',')
+        """,
+            params,
+        )
+
+    def export_to_buffer(self, buffer: Any, keyword: Optional[str] = None):
+        """
+        Export data as CSV into a writable text buffer
+
+        The CSV is written by export_to_csv into a temporary file and copied
+        into the buffer, so dates, decimals and NULLs are formatted exactly
+        as in a file export, e.g. for download buttons or tests.
+
+        Args:
+            buffer (Any): Writable text stream such as io.StringIO
+            keyword (str, optional): Filter by keyword
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "export.csv")
+            self.export_to_csv(filepath, keyword)
+            with open(filepath, "r", encoding="utf-8", newline="") as f:
+                shutil.copyfileobj(f, buffer)
 
     def get_database_stats(self) -> Dict:
         """
@@ -358,31 +636,43 @@ class AuctionDatabase:
         Returns:
             Dict: Database statistics
         """
-        stats = {}
-
-        # Total records
-        result = self.conn.execute("SELECT COUNT(*) FROM auction_results").fetchone()
-        stats["total_records"] = result[0]
-
-        # Unique keywords
-        result = self.conn.execute(
-            "SELECT COUNT(DISTINCT keyword) FROM auction_results"
-        ).fetchone()
-        stats["unique_keywords"] = result[0]
-
-        # Date range
-        result = self.conn.execute(
-            """
-            SELECT MIN(scraped_at), MAX(scraped_at) FROM auction_results
+        return self._cached_agg(
+            "database_stats", self.AGG_CACHE_TTL, self._query_database_stats
+        )
+
+    def _query_database_stats(self) -> Dict:
+        """Run the overall database statistics query"""
+        # Compute every aggregate in a single scan of auction_results
+        result = (
+            self._get_conn()
+            .execute(
+                """
+            SELECT
+                COUNT(*),
+                COUNT(DISTINCT keyword),
+                MIN(scraped_at),
+                MAX(scraped_at),
+                COUNT(current_price),
+                AVG(current_price),
+                MIN(current_price),
+                MAX(current_price),
+                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY current_price)
+            FROM auction_results
         """
-        ).fetchone()
-        stats["date_range"] = {"earliest": result[0], "latest": result[1]}
-
-        # Price statistics
-        price_stats = self.get_price_analytics()
-        stats.update(price_stats)
+            )
+            .fetchone()
+        )
 
-        return stats
+        return {
+            "total_records": result[0],
+            "unique_keywords": result[1],
+            "date_range": {"earliest": result[2], "latest": result[3]},
+            "total_items": result[4],
+            "avg_price": result[5],
+            "min_price": result[6],
+            "max_price": result[7],
+            "median_price": result[8],
+        }
 
     def close(self):
         """Close the database connection"""
@@ -7,19 +7,28 @@ import sys
 import os
 
 # Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
 
 import duckdb
 
+from backend.database.database import DEFAULT_DB_PATH
+
 
 def debug_database():
     """Debug the database table structure"""
     print("🔍 Debugging Database Structure")
     print("=" * 40)
 
+    # Open the real file read-only so debugging never changes its schema, and
+    # stop here if it can't be opened (e.g. another process holds the lock)
+    try:
+        conn = duckdb.connect(DEFAULT_DB_PATH, read_only=True)
+    except duckdb.Error as e:
+        sys.exit(f"❌ Could not open {DEFAULT_DB_PATH} read-only: {e}")
+
     try:
-        # Connect to database
-        conn = duckdb.connect("auction_data.duckdb")
 
         # Check if tables exist
         tables = conn.execute("SHOW TABLES").fetchall()
@@ -34,9 +43,11 @@ def debug_database():
                 for col in schema:
                     print(f"  {col[0]}: {col[1]}")
 
-        # Try to create a simple test table
+        # Try to create a simple test table in memory so the real database
+        # stays untouched
         print("\n🧪 Creating test table...")
-        conn.execute(
+        test_conn = duckdb.connect(":memory:")
+        test_conn.execute(
             """
             CREATE TABLE IF NOT EXISTS test_table (
                 keyword VARCHAR,
@@ -46,7 +57,7 @@ def debug_database():
         )
 
         # Insert test data
-        conn.execute(
+        test_conn.execute(
             """
             INSERT INTO test_table (keyword, description)
             VALUES ('test', 'test description')
@@ -54,14 +65,16 @@ def debug_database():
         )
 
         # Query test data
-        result = conn.execute("SELECT * FROM test_table").fetchall()
+        result = test_conn.execute("SELECT * FROM test_table").fetchall()
         print(f"Test data: {result}")
 
-        conn.close()
+        test_conn.close()
         print("✅ Database debug completed")
 
     except Exception as e:
         print(f"❌ Database debug failed: {e}")
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
@@ -7,18 +7,22 @@ import sys
 import os
 
 # Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
 
 import shutil
 import time
 
+from backend.database.database import DEFAULT_DB_PATH, AuctionDatabase
+
 
 def fix_database_lock():
     """Fix database locking issues by cleaning up and recreating the database"""
     print("🔧 Fixing Database Lock Issues")
     print("=" * 40)
 
-    db_path = "auction_data.duckdb"
+    db_path = DEFAULT_DB_PATH
 
     # Check if database file exists
     if os.path.exists(db_path):
@@ -43,10 +47,7 @@ def fix_database_lock():
 
     # Create a new database file
     try:
-        import duckdb
-
-        conn = duckdb.connect(db_path)
-        conn.close()
+        AuctionDatabase(db_path).close()
         print("✅ Created new database file")
         return True
     except Exception as e:
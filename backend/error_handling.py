@@ -19,6 +19,10 @@ import sys
 from typing import Optional, Type, Any, Dict, List, Union, Callable
 import requests
 
+# Bound once at import for the handle_error hot path. sys.stderr is still
+# looked up per call so redirection (e.g. test output capture) keeps working.
+_format_exc = traceback.format_exc
+
 
 class ScraperError(Exception):
     """Base exception class for scraper-related errors.
@@ -49,15 +53,26 @@ class ScraperError(Exception):
         self.message = message
         self.details = details or {}
         self.original_exception = original_exception
+        self._formatted: Optional[str] = None
+
+        super().__init__(message)
 
-        # Format the error message
-        formatted_message = self.message
-        if self.details:
-            formatted_message += f" - Details: {self.details}"
-        if self.original_exception:
-            formatted_message += f" - Original error: {str(self.original_exception)}"
+    def __str__(self) -> str:
+        """Return the full error message, formatted on first use.
 
-        super().__init__(formatted_message)
+        Returns:
+            The message followed by any details and the original error
+        """
+        if self._formatted is None:
+            formatted_message = self.message
+            if self.details:
+                formatted_message += f" - Details: {self.details}"
+            if self.original_exception:
+                formatted_message += (
+                    f" - Original error: {str(self.original_exception)}"
+                )
+            self._formatted = formatted_message
+        return self._formatted
 
 
 class ConfigurationError(ScraperError):
@@ -115,28 +130,34 @@ def handle_error(
     """
     # Get error details
     error_message = str(error)
-    error_traceback = traceback.format_exc()
-
-    # Create error details
-    details = {
-        "context": context,
-        "error_type": error.__class__.__name__,
-        "traceback": error_traceback,
-    }
+    debug_enabled = logger is not None and logger.isEnabledFor(logging.DEBUG)
+    wrap = reraise and not isinstance(error, error_type)
 
     # Log the error
     if logger:
         logger.error(f"{context}: {error_message}")
-        logger.debug(f"Error details: {details}")
     else:
         print(f"ERROR: {context}: {error_message}", file=sys.stderr)
 
+    # Error details are only consumed by debug logging or the wrapping
+    # exception, so skip building them when neither will happen
+    details = None
+    if debug_enabled or wrap:
+        details = {
+            "context": context,
+            "error_type": error.__class__.__name__,
+        }
+        if debug_enabled:
+            details["traceback"] = _format_exc()
+            logger.debug(f"Error details: {details}")
+
     # Reraise as custom exception if requested
     if reraise:
-        if isinstance(error, error_type):
+        if not wrap:
             raise error
-        else:
-            raise error_type(context, details=details, original_exception=error)
+        # Drop the frame references before wrapping to break the cycle
+        error.__traceback__ = None
+        raise error_type(context, details=details, original_exception=error)
 
 
 def handle_request_error(
@@ -166,7 +187,10 @@ def handle_request_error(
             "context": context,
             "status_code": response.status_code,
             "url": response.url,
-            "response_text": response.text[:500],  # First 500 characters of response
+            # Decode only the first 500 bytes rather than the whole body
+            "response_text": response.content[:500].decode(
+                response.encoding or "utf-8", errors="replace"
+            ),
         }
 
         # Create error message
@@ -15,20 +15,25 @@ Example:
     >>> keywords = read_keywords("sheet_id", client)
     >>> results = [{"Item Description": "Item 1", "Current price": "$10.00"}]
     >>> write_results("sheet_id", "keyword", results, client)
+    >>> write_results_batch("sheet_id", [("keyword", results)], client)
 """
 
-from typing import List, Dict, Any, Optional
+import functools
+from typing import List, Dict, Any, Optional, Tuple
 import gspread
 from gspread.client import Client
 from gspread import Worksheet
 
 
+@functools.lru_cache(maxsize=4)
 def get_gspread_client(service_account_path: str) -> Client:
     """Authenticate with Google Sheets using a service account JSON file.
 
     Creates and returns an authenticated gspread client instance using
     the provided service account credentials file. This client can be
-    used for all subsequent Google Sheets operations.
+    used for all subsequent Google Sheets operations. Clients are cached
+    per path, so repeated calls reuse the same authorized session; call
+    ``get_gspread_client.cache_clear()`` after rotating credentials.
 
     Args:
         service_account_path: Path to the service account JSON file.
@@ -94,7 +99,9 @@ def write_results(
 
     Appends new search results to the 'RESULTS TEMPLATE' worksheet in the specified Google Sheet.
     If the worksheet doesn't exist, it creates it with appropriate headers.
-    The function also attempts to render image URLs as actual images in the spreadsheet.
+    Image URLs are written as IMAGE formulas so they render as actual images
+    in the spreadsheet. All rows are sent in one API request; this is
+    write_results_batch() with a single keyword.
 
     The worksheet will be structured with the following columns:
     - Keyword: The search keyword used
@@ -120,7 +127,56 @@ def write_results(
         gspread.exceptions.SpreadsheetNotFound: If the sheet_id is invalid.
         gspread.exceptions.APIError: If there's an error with the Google Sheets API.
     """
-    # Define the required columns
+    # Rows and IMAGE formulas go out together in a single batched request
+    write_results_batch(sheet_id, [(keyword, results)], client)
+
+
+def write_results_batch(
+    sheet_id: str,
+    pending_writes: List[Tuple[str, List[Dict[str, str]]]],
+    client: Client,
+) -> None:
+    """Write results for several keywords to the 'RESULTS TEMPLATE' tab at once.
+
+    Behaves like calling write_results() once per keyword, but the sheet is
+    opened and measured only once and all rows are sent in a single
+    values:batchUpdate request. Image URLs are written as IMAGE formulas in
+    column E, and a missing header row is added in the same request.
+
+    Args:
+        sheet_id: The ID of the Google Sheet to write to.
+        pending_writes: List of (keyword, results) pairs, in the order the
+            rows should be appended.
+        client: Authenticated gspread client instance.
+            Should be obtained from get_gspread_client().
+
+    Returns:
+        None
+
+    Raises:
+        gspread.exceptions.SpreadsheetNotFound: If the sheet_id is invalid.
+        gspread.exceptions.APIError: If there's an error with the Google Sheets API.
+    """
+    # Build every row up front so the sheet only has to be touched once
+    data = []
+    for keyword, results in pending_writes:
+        for row in results:
+            image_url = row.get("Auction image / thumbnail URL (extra credit)", "")
+            if image_url and image_url.strip():
+                image_url = f'=IMAGE("{image_url}", 3, 100, 100)'
+            data.append(
+                [
+                    keyword,
+                    row.get("Item Description", ""),
+                    row.get("Auction end date", ""),
+                    row.get("Current price", ""),
+                    image_url,
+                ]
+            )
+
+    if not data:
+        return
+
     columns = [
         "Keyword",
         "Item Description",
@@ -135,53 +191,19 @@ def write_results(
     # Try to open the 'RESULTS TEMPLATE' worksheet, or create it if it doesn't exist
     try:
         worksheet = sheet.worksheet("RESULTS TEMPLATE")
-        # Check if the worksheet has headers - if not, add them
-        if worksheet.row_count == 0 or worksheet.cell(1, 1).value == "":
-            worksheet.update("A1", [columns])
+        existing_data = worksheet.get_all_values()
     except gspread.exceptions.WorksheetNotFound:
         worksheet = sheet.add_worksheet(
             title="RESULTS TEMPLATE", rows="100", cols=str(len(columns))
         )
-        # Add headers to the new worksheet
-        worksheet.update("A1", [columns])
+        existing_data = []
 
-    # Get the current row count to determine where to append new data
-    existing_data = worksheet.get_all_values()
-    next_row = (
-        len(existing_data) + 1 if existing_data else 2
-    )  # Start from row 2 if there are headers, or 1 if empty
+    # Send the header row in the same request if the sheet doesn't have one
+    updates = []
+    if not existing_data or not existing_data[0] or existing_data[0][0] == "":
+        updates.append({"range": "A1", "values": [columns]})
+    next_row = len(existing_data) + 1 if existing_data else 2
 
-    # Prepare the data for appending: each row is a list of values
-    data = []
-    for row in results:
-        # Ensure the 'Keyword' column is filled with the provided keyword
-        row_data = [
-            keyword,
-            row.get("Item Description", ""),
-            row.get("Auction end date", ""),
-            row.get("Current price", ""),
-            row.get("Auction image / thumbnail URL (extra credit)", ""),
-        ]
-        data.append(row_data)
-
-    # Append the data to the worksheet starting at the next available row
-    if data:  # Only update if we have data to add
-        append_range = f"A{next_row}"
-        worksheet.update(append_range, data)
-        print(f"✅ Added {len(data)} rows starting at row {next_row}")
-
-    # Add images to column E (5th column) if image URLs are available
-    try:
-        for i, row in enumerate(results, start=next_row):  # Start from the next row
-            image_url = row.get("Auction image / thumbnail URL (extra credit)", "")
-            if image_url and image_url.strip():
-                try:
-                    # Insert image using cell update method
-                    worksheet.update_cell(i, 5, f'=IMAGE("{image_url}", 3, 100, 100)')
-                    print(f"✅ Added image to row {i}, column E: {image_url}")
-                except Exception as e:
-                    print(f"⚠️ Could not add image to row {i}, column E: {e}")
-                    # Fallback: just put the URL as text
-                    worksheet.update_cell(i, 5, image_url)
-    except Exception as e:
-        print(f"⚠️ Error adding images to sheet: {e}")
+    updates.append({"range": f"A{next_row}", "values": data})
+    worksheet.batch_update(updates, value_input_option="USER_ENTERED")
+    print(f"✅ Added {len(data)} rows starting at row {next_row}")
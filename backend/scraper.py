@@ -20,10 +20,20 @@ Example:
     >>> results = scrape_auction_results("vintage watch", max_results=5)
     >>> for result in results:
     ...     print(result["Item Description"], result["Current price"])
+
+    Several keywords can be scraped concurrently from async code:
+
+    >>> results = await asyncio.gather(
+    ...     scrape_auction_results_async("vintage", 5),
+    ...     scrape_auction_results_async("antique", 5),
+    ... )
 """
 
+import asyncio
+import hashlib
 import time
 import random
+import threading
 import requests
 from typing import List, Dict, Optional, Any
 from selenium import webdriver
@@ -61,6 +71,11 @@ import json
 import os
 
 
+# Driver setup downloads (webdriver-manager) or patches (undetected-chromedriver)
+# a chromedriver binary shared on disk, which is not safe to do concurrently
+_DRIVER_SETUP_LOCK = threading.Lock()
+
+
 class AntiDetectionScraper:
     """Enhanced scraper with anti-detection and captcha handling capabilities.
 
@@ -282,11 +297,12 @@ class AntiDetectionScraper:
             )
 
             # Create driver with version_main parameter for better compatibility
-            try:
-                driver = uc.Chrome(options=options, version_main=None)
-            except Exception:
-                # Fallback without version_main
-                driver = uc.Chrome(options=options)
+            with _DRIVER_SETUP_LOCK:
+                try:
+                    driver = uc.Chrome(options=options, version_main=None)
+                except Exception:
+                    # Fallback without version_main
+                    driver = uc.Chrome(options=options)
 
             # Execute stealth scripts
             driver.execute_script(
@@ -623,8 +639,9 @@ class AntiDetectionScraper:
             driver = None
             try:
                 options = self.setup_stealth_chrome_options()
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=options)
+                with _DRIVER_SETUP_LOCK:
+                    service = Service(ChromeDriverManager().install())
+                    driver = webdriver.Chrome(service=service, options=options)
 
                 # Remove webdriver property
                 driver.execute_script(
@@ -1155,34 +1172,69 @@ class AntiDetectionScraper:
 
 
 # Global scraper instance
-_scraper_instance: Optional[AntiDetectionScraper] = None
+_scraper_instances = threading.local()
 
 
 def get_scraper() -> AntiDetectionScraper:
-    """Get the global scraper instance.
+    """Get the scraper instance for the calling thread.
 
-    Creates a singleton instance of AntiDetectionScraper if it doesn't exist
-    and returns it for reuse across the application. This function implements
-    the singleton pattern to ensure that only one scraper instance is created
-    and reused throughout the application.
+    Creates an AntiDetectionScraper the first time a thread asks for one
+    and returns it for reuse on that thread. Each thread gets its own
+    instance because the requests and cloudscraper sessions it holds are
+    not safe to share between threads that scrape concurrently.
 
-    Using a singleton instance helps:
+    Using one instance per thread helps:
     1. Reduce resource usage by reusing the same session
     2. Maintain consistent behavior across multiple scraping operations
-    3. Avoid creating multiple browser instances unnecessarily
+    3. Keep concurrent scrapes from sharing session state
 
     Returns:
-        AntiDetectionScraper: The global scraper instance that can be
-            used for scraping operations.
+        AntiDetectionScraper: The calling thread's scraper instance that
+            can be used for scraping operations.
     """
-    global _scraper_instance
-    if _scraper_instance is None:
-        _scraper_instance = AntiDetectionScraper()
-    return _scraper_instance
+    scraper = getattr(_scraper_instances, "scraper", None)
+    if scraper is None:
+        scraper = _scraper_instances.scraper = AntiDetectionScraper()
+    return scraper
+
+
+# On-disk cache of scrape results, used when callers opt in with use_cache
+SCRAPE_CACHE_DIR = ".scraper-cache"
+SCRAPE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def _scrape_cache_path(keyword: str, max_results: int) -> str:
+    """Return the cache file path for a keyword and result limit."""
+    digest = hashlib.sha256(f"{keyword}:{max_results}".encode()).hexdigest()
+    return os.path.join(SCRAPE_CACHE_DIR, f"{digest}.json")
+
+
+def _load_cached_results(path: str) -> Optional[List[Dict[str, str]]]:
+    """Load cached results if the file exists and is younger than the TTL."""
+    try:
+        if time.time() - os.path.getmtime(path) > SCRAPE_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_results(path: str, results: List[Dict[str, str]]) -> None:
+    """Write results to the cache, ignoring filesystem errors."""
+    # Don't cache the placeholder row returned when every method failed
+    if all(r.get("Current price") == "N/A" for r in results):
+        return
+    try:
+        os.makedirs(SCRAPE_CACHE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f)
+    except OSError as e:
+        print(f"Warning: could not write scrape cache {path}: {e}")
 
 
 def scrape_auction_results(
-    keyword: str, max_results: Optional[int] = None
+    keyword: str, max_results: Optional[int] = None, use_cache: bool = False
 ) -> List[Dict[str, str]]:
     """Enhanced scrape auction results with anti-detection and captcha handling.
 
@@ -1192,7 +1244,7 @@ def scrape_auction_results(
     and provides a simple interface to the complex scraping functionality.
 
     The function:
-    1. Gets or creates a singleton scraper instance
+    1. Gets or creates the calling thread's scraper instance
     2. Delegates to the scraper's retry mechanism
     3. Returns the scraped auction results
 
@@ -1203,6 +1255,10 @@ def scrape_auction_results(
         keyword: The search keyword to scrape for.
         max_results: Maximum number of results to return.
             If None, uses the configured MAX_RESULTS from config.
+        use_cache: If True, return results cached on disk in
+            SCRAPE_CACHE_DIR for the same keyword and max_results when they
+            are less than SCRAPE_CACHE_TTL seconds old, and cache fresh
+            results. Defaults to False so live callers always scrape.
 
     Returns:
         List[Dict[str, str]]: List of dictionaries with auction result data.
@@ -1221,5 +1277,42 @@ def scrape_auction_results(
     # Use configured max_retries
     max_retries = get_config().SCRAPER_MAX_RETRIES
 
+    if use_cache:
+        cache_path = _scrape_cache_path(keyword, max_results)
+        cached = _load_cached_results(cache_path)
+        if cached is not None:
+            return cached
+
     scraper = get_scraper()
-    return scraper.scrape_with_retry(keyword, max_results, max_retries)
+    results = scraper.scrape_with_retry(keyword, max_results, max_retries)
+
+    if use_cache:
+        _store_cached_results(cache_path, results)
+    return results
+
+
+async def scrape_auction_results_async(
+    keyword: str, max_results: Optional[int] = None, use_cache: bool = False
+) -> List[Dict[str, str]]:
+    """Asynchronous variant of scrape_auction_results.
+
+    The scraping methods (Selenium, cloudscraper) are blocking, so the scrape
+    runs in a worker thread. This lets callers overlap the network waits of
+    several keywords with asyncio.gather instead of scraping them one after
+    another. Concurrent calls run on different threads, so each uses its own
+    scraper from get_scraper() and no session state is shared.
+
+    Args:
+        keyword: The search keyword to scrape for.
+        max_results: Maximum number of results to return.
+            If None, uses the configured MAX_RESULTS from config.
+        use_cache: Whether to use the on-disk result cache, as in
+            scrape_auction_results.
+
+    Returns:
+        List[Dict[str, str]]: Same result dictionaries as
+            scrape_auction_results.
+    """
+    return await asyncio.to_thread(
+        scrape_auction_results, keyword, max_results, use_cache
+    )
@@ -4,8 +4,10 @@ Setup script for Coemeta WebScraper.
 Creates virtual environment and installs dependencies.
 """
 
+import importlib.util
 import os
 import sys
+import shutil
 import subprocess
 import venv
 from pathlib import Path
@@ -21,7 +23,10 @@ def create_venv():
         print("Virtual environment already exists.")
     else:
         print("Creating virtual environment...")
-        venv.create(str(venv_path), with_pip=True)
+        # Skip the slow ensurepip bootstrap; install_requirements installs
+        # into the venv from outside. Symlink the interpreter on POSIX.
+        builder = venv.EnvBuilder(with_pip=False, symlinks=(os.name != "nt"))
+        builder.create(str(venv_path))
         print("Virtual environment created.")
     
     return venv_path
@@ -42,13 +47,58 @@ def get_venv_python_path():
 
 
 def install_requirements(python_path):
-    """Install the requirements using the virtual environment's pip."""
+    """Install the requirements and the project itself into the virtual environment.
+
+    The project is installed in editable mode (``pip install -e .``) so the
+    ``backend`` and ``frontend`` packages are importable from anywhere
+    without adjusting sys.path.
+
+    When setup is already running inside the target venv, pip is invoked
+    in-process. Otherwise the install is driven from outside the venv (which
+    is created without pip) in a single subprocess: with uv when available,
+    or with the current interpreter's pip targeting the venv (pip >= 22.3).
+    If neither is available, pip is bootstrapped into the venv with
+    ensurepip and run from there. Installation failures raise instead of
+    being ignored.
+    """
     # Get the project root directory (one level up from backend)
     root_dir = Path(__file__).parent.parent
     requirements_path = root_dir / "requirements.txt"
+    pip_args = ["install", "-r", str(requirements_path), "-e", str(root_dir)]
     
     print("Installing dependencies...")
-    subprocess.run([python_path, "-m", "pip", "install", "-r", str(requirements_path)])
+    venv_prefix = Path(python_path).parent.parent
+    pip_main = None
+    if Path(sys.prefix).resolve() == venv_prefix.resolve():
+        try:
+            from pip._internal.cli.main import main as pip_main
+        except ImportError:
+            pass  # venv created without pip; install from outside instead
+
+    if pip_main is not None:
+        returncode = pip_main(pip_args)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, ["pip"] + pip_args)
+    else:
+        uv_path = shutil.which("uv")
+        if uv_path:
+            command = [uv_path, "pip", "install", "--python", python_path]
+        elif importlib.util.find_spec("pip") is not None:
+            command = [sys.executable, "-m", "pip", "--python", python_path, "install"]
+        else:
+            print("Neither uv nor pip found; bootstrapping pip into the venv...")
+            try:
+                subprocess.run(
+                    [python_path, "-m", "ensurepip", "--upgrade"], check=True
+                )
+            except (OSError, subprocess.CalledProcessError) as e:
+                raise RuntimeError(
+                    f"Cannot install dependencies: uv is not on PATH, {sys.executable} "
+                    f"has no pip, and ensurepip failed in {venv_prefix} ({e}). "
+                    "Install uv or pip and run setup again."
+                ) from e
+            command = [python_path, "-m", "pip", "install"]
+        subprocess.run(command + pip_args[1:], check=True)
     print("Dependencies installed successfully!")
 
 
@@ -0,0 +1,43 @@
+"""Shared pytest configuration for the Coemeta WebScraper test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project root importable once for every test module
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+
+def pytest_configure(config):
+    """Register the custom markers used across the test suite"""
+    config.addinivalue_line(
+        "markers",
+        "serial: test talks to the shared Google Sheet and must not run in parallel",
+    )
+    config.addinivalue_line(
+        "markers",
+        "network: test needs live network access; run with --run-network",
+    )
+
+
+def pytest_addoption(parser):
+    """Add the opt-in switch for tests that hit live services"""
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked 'network' (live Google Sheets and scraping)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless --run-network was given"""
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
@@ -3,94 +3,299 @@
 Test script for DuckDB integration
 """
 
-import sys
-import os
-
-# Add the project root to the Python path
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+import io
 
+import duckdb
 import pandas as pd
+import pytest
 from backend.database.database import AuctionDatabase
 
+# Schema of databases created before keywords.id had a sequence default
+BASELINE_SCHEMA = """
+    CREATE TABLE auction_results (
+        keyword VARCHAR,
+        item_description TEXT,
+        current_price DECIMAL(10,2),
+        auction_end_date DATE,
+        image_url TEXT,
+        scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        source_url TEXT
+    );
+    CREATE TABLE keywords (
+        id INTEGER PRIMARY KEY,
+        keyword VARCHAR UNIQUE,
+        last_scraped TIMESTAMP,
+        total_results INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE scraping_sessions (
+        id INTEGER PRIMARY KEY,
+        session_start TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        session_end TIMESTAMP,
+        keywords_processed INTEGER DEFAULT 0,
+        total_results INTEGER DEFAULT 0,
+        status VARCHAR DEFAULT 'running'
+    );
+"""
+
+TEST_RESULTS = [
+    {
+        "Item Description": "Test Item 1",
+        "Current price": "$100.00",
+        "Auction end date": "2024-12-31",
+        "Auction image / thumbnail URL (extra credit)": "http://example.com/image1.jpg",
+    },
+    {
+        "Item Description": "Test Item 2",
+        "Current price": "$200.00",
+        "Auction end date": "2024-12-30",
+        "Auction image / thumbnail URL (extra credit)": "http://example.com/image2.jpg",
+    },
+]
+
 
 def test_duckdb_integration():
     """Test DuckDB database functionality"""
     print("🦆 Testing DuckDB Integration")
     print("=" * 50)
 
-    try:
-        # Initialize database
-        db = AuctionDatabase("database/test_auction_data.duckdb")
+    # Initialize database
+    with AuctionDatabase(":memory:") as db:
         print("✅ Database initialized successfully")
 
-        # Test data
-        test_results = [
-            {
-                "Item Description": "Test Item 1",
-                "Current price": "$100.00",
-                "Auction end date": "2024-12-31",
-                "Auction image / thumbnail URL (extra credit)": "http://example.com/image1.jpg",
-            },
-            {
-                "Item Description": "Test Item 2",
-                "Current price": "$200.00",
-                "Auction end date": "2024-12-30",
-                "Auction image / thumbnail URL (extra credit)": "http://example.com/image2.jpg",
-            },
-        ]
-
         # Test insertion
         print("\n📝 Testing data insertion...")
-        inserted_count = db.insert_auction_results("test-keyword", test_results)
+        inserted_count = db.insert_auction_results("test-keyword", TEST_RESULTS)
+        assert inserted_count == 2
         print(f"✅ Inserted {inserted_count} records")
 
+        # Test bulk insertion across keywords in one transaction
+        print("\n📦 Testing bulk insertion...")
+        inserted_count = db.insert_auction_results_bulk(
+            [("bulk-a", TEST_RESULTS), ("bulk-b", TEST_RESULTS[:1]), ("bulk-c", [])]
+        )
+        assert inserted_count == 3
+        print(f"✅ Bulk inserted {inserted_count} records")
+
         # Test querying
         print("\n🔍 Testing data querying...")
         results = db.get_auction_results(keyword="test-keyword")
+        assert len(results) == 2
         print(f"✅ Retrieved {len(results)} records")
 
         # Test statistics
         print("\n📊 Testing statistics...")
         stats = db.get_database_stats()
+        assert stats["total_records"] == 5
         print(f"✅ Database stats: {stats['total_records']} total records")
 
         # Test keyword stats
         print("\n📈 Testing keyword statistics...")
         keyword_stats = db.get_keyword_stats()
+        assert len(keyword_stats) == 3
         print(f"✅ Keyword stats: {len(keyword_stats)} keywords")
 
         # Test price analytics
         print("\n💰 Testing price analytics...")
         price_stats = db.get_price_analytics()
+        assert price_stats["avg_price"] == pytest.approx(140.0)
         print(f"✅ Price analytics: avg=${price_stats.get('avg_price', 0):.2f}")
 
         # Test search
         print("\n🔎 Testing search functionality...")
         search_results = db.search_items("Test Item")
+        assert len(search_results) == 5
         print(f"✅ Search results: {len(search_results)} items found")
 
+        # Test column pushdown
+        print("\n🧮 Testing column selection...")
+        recent = db.get_recent_results(columns=("keyword", "current_price"))
+        assert list(recent.columns) == ["keyword", "current_price"]
+        print(f"✅ Column selection: {list(recent.columns)}")
+
         # Test export
         print("\n📤 Testing export functionality...")
-        db.export_to_csv("test_export.csv")
-        print("✅ Export completed")
+        buffer = io.StringIO()
+        db.export_to_buffer(buffer)
+        assert len(buffer.getvalue().splitlines()) == 6
+        print(f"✅ Export completed: {len(buffer.getvalue().splitlines())} lines")
+
+    print("\n🎉 All DuckDB tests passed!")
+
+
+def test_bulk_insert_tracks_keywords():
+    """Bulk inserts store rows per keyword and accumulate keyword totals"""
+    with AuctionDatabase(":memory:") as db:
+        assert db.insert_auction_results_bulk([("empty", [])]) == 0
+        db.insert_auction_results_bulk([("a", TEST_RESULTS), ("b", TEST_RESULTS[:1])])
+        db.insert_auction_results_bulk([("a", TEST_RESULTS[:1]), ("c", [])])
+
+        rows = db.conn.execute(
+            "SELECT keyword, COUNT(*) FROM auction_results GROUP BY keyword"
+        ).fetchall()
+        assert sorted(rows) == [("a", 3), ("b", 1)]
+
+        totals = db.conn.execute(
+            "SELECT keyword, total_results FROM keywords ORDER BY keyword"
+        ).fetchall()
+        assert totals == [("a", 3), ("b", 1)]
+
+
+def test_column_selection():
+    """Queries return only the requested columns and reject unknown ones"""
+    with AuctionDatabase(":memory:") as db:
+        db.insert_auction_results("kw", TEST_RESULTS)
+
+        found = db.search_items("Item 1", columns=["item_description"])
+        assert list(found.columns) == ["item_description"]
+        assert found["item_description"].tolist() == ["Test Item 1"]
+
+        table = db.get_recent_results(as_arrow=True, columns=["keyword"])
+        assert table.column_names == ["keyword"]
+        assert table.num_rows == 2
+
+        with pytest.raises(ValueError, match="price; DROP"):
+            db.search_items("Item", columns=["keyword", "price; DROP"])
+
+    with pytest.raises(ValueError, match="nope"):
+        AuctionDatabase._select_list(["keyword", "nope"])
+    assert AuctionDatabase._select_list(None) == "*"
+
+
+def test_aggregate_cache():
+    """Stats are reused until an insert, a newer scrape or the TTL expires"""
+    with AuctionDatabase(":memory:") as db:
+        queries = []
+        query_database_stats = db._query_database_stats
+
+        def counting_query():
+            queries.append(1)
+            return query_database_stats()
+
+        db._query_database_stats = counting_query
+
+        db.insert_auction_results("kw", TEST_RESULTS)
+        stats = db.get_database_stats()
+        assert db.get_database_stats() == stats
+        assert len(queries) == 1
+
+        # Inserting through the database clears the cache
+        db.insert_auction_results("kw", TEST_RESULTS[:1])
+        assert db.get_database_stats()["total_records"] == 3
+        assert db.get_database_stats()["total_records"] == 3
+        assert len(queries) == 2
+
+        # A newer MAX(scraped_at) from another writer also invalidates it
+        db.conn.execute(
+            "INSERT INTO auction_results (keyword, scraped_at) "
+            "VALUES ('other', TIMESTAMP '2100-01-01')"
+        )
+        assert db.get_database_stats()["total_records"] == 4
+        assert len(queries) == 3
+
+        # Entries older than the TTL are recomputed
+        db.AGG_CACHE_TTL = 0
+        db.get_database_stats()
+        assert len(queries) == 4
+
+
+def test_aggregate_cache_returns_copies():
+    """Modifying a cached aggregate does not change what later callers get"""
+    with AuctionDatabase(":memory:") as db:
+        db.insert_auction_results("kw", TEST_RESULTS)
+
+        stats = db.get_database_stats()
+        stats["total_records"] = -1
+        stats["date_range"]["latest"] = None
+        fresh = db.get_database_stats()
+        assert fresh["total_records"] == 2
+        assert fresh["date_range"]["latest"] is not None
+
+        keyword_stats = db.get_keyword_stats()
+        keyword_stats.rename(columns={"keyword": "Keyword"}, inplace=True)
+        assert "keyword" in db.get_keyword_stats().columns
+
+
+def test_recent_results_window():
+    """get_recent_results only returns rows scraped within the last N hours"""
+    with AuctionDatabase(":memory:") as db:
+        db.insert_auction_results_bulk(
+            [("new", TEST_RESULTS[:1]), ("old", TEST_RESULTS[:1])]
+        )
+        db.conn.execute(
+            "UPDATE auction_results SET scraped_at = scraped_at - INTERVAL 30 HOUR "
+            "WHERE keyword = 'old'"
+        )
+
+        assert db.get_recent_results(24)["keyword"].tolist() == ["new"]
+        assert db.get_recent_results(48)["keyword"].tolist() == ["new", "old"]
+
+
+def test_export_to_csv(tmp_path):
+    """COPY export writes all or keyword-filtered rows, even to quoted paths"""
+    with AuctionDatabase(":memory:") as db:
+        db.insert_auction_results_bulk([("lamp", TEST_RESULTS), ("desk", TEST_RESULTS)])
+
+        all_path = tmp_path / "all.csv"
+        db.export_to_csv(str(all_path))
+        exported = pd.read_csv(all_path)
+        assert len(exported) == 4
+        assert list(exported.columns) == list(AuctionDatabase.RESULT_COLUMNS)
+
+        quoted_path = tmp_path / "it's lamps.csv"
+        db.export_to_csv(str(quoted_path), keyword="LAMP")
+        exported = pd.read_csv(quoted_path)
+        assert exported["keyword"].tolist() == ["lamp", "lamp"]
+
+
+def test_export_to_buffer_matches_csv(tmp_path):
+    """The buffer export is byte-for-byte the same CSV as the file export"""
+    with AuctionDatabase(":memory:") as db:
+        results = TEST_RESULTS + [{"Item Description": "No price or date"}]
+        db.insert_auction_results("lamp", results)
+
+        path = tmp_path / "export.csv"
+        db.export_to_csv(str(path))
+        buffer = io.StringIO()
+        db.export_to_buffer(buffer)
+
+        assert buffer.getvalue() == path.read_text(encoding="utf-8")
+        header, *rows = buffer.getvalue().splitlines()
+        assert header.split(",") == list(AuctionDatabase.RESULT_COLUMNS)
+        assert "lamp,Test Item 1,100.00,2024-12-31," in buffer.getvalue()
+        assert "lamp,No price or date,,,," in buffer.getvalue()
+
+
+def test_insert_into_baseline_schema(tmp_path):
+    """Existing databases get the keywords.id default and accept inserts"""
+    db_path = str(tmp_path / "baseline.duckdb")
+    conn = duckdb.connect(db_path)
+    conn.execute(BASELINE_SCHEMA)
+    conn.execute("INSERT INTO keywords (id, keyword) VALUES (7, 'old-keyword')")
+    conn.close()
+
+    with AuctionDatabase(db_path) as db:
+        results = [{"Item Description": "Item", "Current price": "$5.00"}]
+        assert db.insert_auction_results("new-keyword", results) == 1
+        assert db.get_database_stats()["total_records"] == 1
+        keywords = db.conn.execute(
+            "SELECT id, keyword FROM keywords ORDER BY id"
+        ).fetchall()
+        assert keywords == [(7, "old-keyword"), (8, "new-keyword")]
 
-        # Clean up
-        db.close()
-        import os
 
-        if os.path.exists("database/test_auction_data.duckdb"):
-            os.remove("database/test_auction_data.duckdb")
-        if os.path.exists("test_export.csv"):
-            os.remove("test_export.csv")
+def test_failed_keyword_upsert_rolls_back(tmp_path):
+    """A failing keyword upsert raises and leaves no result rows behind"""
+    with AuctionDatabase(str(tmp_path / "rollback.duckdb")) as db:
+        results = [{"Item Description": "Item", "Current price": "$5.00"}]
+        db.insert_auction_results("kept", results)
+        db.conn.execute("DROP TABLE keywords")
 
-        print("\n🎉 All DuckDB tests passed!")
-        return True
+        with pytest.raises(duckdb.CatalogException):
+            db.insert_auction_results_bulk([("lost", results), ("lost-2", results)])
 
-    except Exception as e:
-        print(f"❌ DuckDB test failed: {e}")
-        return False
+        rows = db.conn.execute("SELECT keyword FROM auction_results").fetchall()
+        assert rows == [("kept",)]
 
 
 if __name__ == "__main__":
@@ -5,27 +5,63 @@ Integration tests for Google Sheets functionality
 
 import unittest
 import os
+
+import pytest
 from backend.google_sheets import get_gspread_client, read_keywords, write_results
 from backend.config import get_service_account_path, get_sheet_id, validate_credentials
 
 
+# Progress output is opt-in: set COEMETA_TEST_VERBOSE=1 to see it
+_VERBOSE = os.environ.get("COEMETA_TEST_VERBOSE") == "1"
+
+
+def _say(message: str) -> None:
+    """Print a progress message when verbose test output is enabled"""
+    if _VERBOSE:
+        print(message)
+
+
+# Evaluated once at import so a missing credentials file skips the whole
+# class instead of every test probing for it
+_HAS_CREDS = validate_credentials()
+
+
+@pytest.mark.network
+@pytest.mark.serial
+@unittest.skipUnless(_HAS_CREDS, "Google Sheets credentials not configured")
 class TestGoogleSheetsIntegration(unittest.TestCase):
     """Integration tests for Google Sheets module"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.service_account_path = get_service_account_path()
-        self.sheet_id = get_sheet_id()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the class"""
+        cls.service_account_path = get_service_account_path()
+        cls.sheet_id = get_sheet_id()
+
+        # Authenticate once; a failure is re-raised inside each test so it
+        # is reported (or skipped) there rather than erroring the class
+        try:
+            cls.client = get_gspread_client(cls.service_account_path)
+            cls.client_error = None
+        except Exception as e:
+            cls.client = None
+            cls.client_error = e
+
+    def _client(self):
+        """Return the shared Google Sheets client"""
+        if self.client_error is not None:
+            raise self.client_error
+        return self.client
 
     def test_credentials_validation(self):
         """Test that credentials are properly configured"""
-        print("\n🔍 Testing Google Sheets credentials...")
+        _say("\n🔍 Testing Google Sheets credentials...")
 
-        is_valid = validate_credentials()
+        is_valid = _HAS_CREDS
         if is_valid:
-            print("✅ Credentials are properly configured")
+            _say("✅ Credentials are properly configured")
         else:
-            print("⚠️  Credentials not configured - some tests may fail")
+            _say("⚠️  Credentials not configured - some tests may fail")
 
         # Don't fail the test if credentials aren't configured
         # This allows the test suite to run even without credentials
@@ -33,43 +69,43 @@ class TestGoogleSheetsIntegration(unittest.TestCase):
 
     def test_gspread_client_authentication(self):
         """Test Google Sheets client authentication"""
-        print("\n🔍 Testing Google Sheets authentication...")
+        _say("\n🔍 Testing Google Sheets authentication...")
 
         try:
-            client = get_gspread_client(self.service_account_path)
+            client = self._client()
             self.assertIsNotNone(client)
-            print("✅ Google Sheets client authenticated successfully")
+            _say("✅ Google Sheets client authenticated successfully")
 
             # Test that we can access the client
             self.assertTrue(hasattr(client, "open_by_key"))
 
         except Exception as e:
-            print(f"❌ Google Sheets authentication failed: {e}")
+            _say(f"❌ Google Sheets authentication failed: {e}")
             # Don't fail the test if credentials aren't configured
             self.skipTest(f"Google Sheets authentication failed: {e}")
 
     def test_read_keywords_from_sheet(self):
         """Test reading keywords from Google Sheet"""
-        print("\n🔍 Testing keyword reading from Google Sheets...")
+        _say("\n🔍 Testing keyword reading from Google Sheets...")
 
         try:
-            client = get_gspread_client(self.service_account_path)
+            client = self._client()
             keywords = read_keywords(self.sheet_id, client)
 
             self.assertIsInstance(keywords, list)
-            print(f"✅ Successfully read {len(keywords)} keywords from sheet")
+            _say(f"✅ Successfully read {len(keywords)} keywords from sheet")
 
             if keywords:
-                print(f"Sample keywords: {keywords[:3]}...")
+                _say(f"Sample keywords: {keywords[:3]}...")
 
         except Exception as e:
-            print(f"❌ Failed to read keywords: {e}")
+            _say(f"❌ Failed to read keywords: {e}")
             # Don't fail the test if sheet doesn't exist or credentials aren't configured
             self.skipTest(f"Failed to read keywords: {e}")
 
     def test_write_results_to_sheet(self):
         """Test writing results to Google Sheet"""
-        print("\n🔍 Testing result writing to Google Sheets...")
+        _say("\n🔍 Testing result writing to Google Sheets...")
 
         # Create test data
         test_keyword = "test_keyword"
@@ -89,29 +125,29 @@ class TestGoogleSheetsIntegration(unittest.TestCase):
         ]
 
         try:
-            client = get_gspread_client(self.service_account_path)
+            client = self._client()
 
             # Write test results
             write_results(self.sheet_id, test_keyword, test_results, client)
-            print("✅ Successfully wrote test results to Google Sheets")
+            _say("✅ Successfully wrote test results to Google Sheets")
 
         except Exception as e:
-            print(f"❌ Failed to write results: {e}")
+            _say(f"❌ Failed to write results: {e}")
             # Don't fail the test if sheet doesn't exist or credentials aren't configured
             self.skipTest(f"Failed to write results: {e}")
 
     def test_full_google_sheets_workflow(self):
         """Test the complete Google Sheets workflow"""
-        print("\n🔍 Testing complete Google Sheets workflow...")
+        _say("\n🔍 Testing complete Google Sheets workflow...")
 
         try:
             # Step 1: Authenticate
-            client = get_gspread_client(self.service_account_path)
-            print("✅ Step 1: Authentication successful")
+            client = self._client()
+            _say("✅ Step 1: Authentication successful")
 
             # Step 2: Read keywords
             keywords = read_keywords(self.sheet_id, client)
-            print(f"✅ Step 2: Read {len(keywords)} keywords")
+            _say(f"✅ Step 2: Read {len(keywords)} keywords")
 
             # Step 3: Write test results
             test_keyword = "workflow_test"
@@ -125,12 +161,12 @@ class TestGoogleSheetsIntegration(unittest.TestCase):
             ]
 
             write_results(self.sheet_id, test_keyword, test_results, client)
-            print("✅ Step 3: Wrote test results successfully")
+            _say("✅ Step 3: Wrote test results successfully")
 
-            print("✅ Complete Google Sheets workflow successful")
+            _say("✅ Complete Google Sheets workflow successful")
 
         except Exception as e:
-            print(f"❌ Google Sheets workflow failed: {e}")
+            _say(f"❌ Google Sheets workflow failed: {e}")
             # Don't fail the test if credentials aren't configured
             self.skipTest(f"Google Sheets workflow failed: {e}")
 
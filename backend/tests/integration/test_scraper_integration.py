@@ -17,10 +17,13 @@ import time
 import os
 from typing import Dict, List, Any, Optional, Union
 
+import pytest
+
 from backend.scraper import scrape_auction_results
 from backend.utils import validate_auction_data
 
 
+@pytest.mark.network
 class TestScraperIntegration(unittest.TestCase):
     """Integration tests for the scraper module.
     
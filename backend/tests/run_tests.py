@@ -4,100 +4,182 @@ Test runner for the Coemeta WebScraper project
 Runs both unit and integration tests
 """
 
-import unittest
+import glob
+import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the project root to the Python path
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+
+
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 )
 
+# Test modules run by each suite. Keep this in sync when adding test files;
+# any test_*.py file missing from it is reported as a warning.
+TEST_MODULES = {
+    "unit": ["test_scraper.py", "test_utils.py"],
+    "integration": [
+        "test_full_pipeline_integration.py",
+        "test_google_sheets_integration.py",
+        "test_scraper_integration.py",
+    ],
+    "database": ["test_duckdb.py"],
+    "utilities": [
+        "test_connection.py",
+        "test_image_integration.py",
+        "test_keywords_scraping.py",
+        "test_valid_results.py",
+        "test_write_results.py",
+    ],
+}
+
+# Section banners shared by the suite runners and the summary
+_BANNER_30 = "=" * 30
+_BANNER_50 = "=" * 50
+_BANNER_60 = "=" * 60
+
+
+def _parallel_args():
+    """Return pytest-xdist arguments, or none if the plugin isn't installed"""
+    try:
+        import xdist  # noqa: F401
+    except ImportError:
+        return []
+    # loadfile keeps every test from one module on the same worker
+    return ["-n", "auto", "--dist=loadfile"]
+
+
+# Live Google Sheets / AuctionZip tests only run when asked for explicitly
+_RUN_NETWORK = "--run-network" in sys.argv[1:]
+
+
+def _pytest(args):
+    """Run pytest in a subprocess and return its exit code and output"""
+    if _RUN_NETWORK:
+        args = [*args, "--run-network"]
+    completed = subprocess.run(
+        [sys.executable, "-m", "pytest", *args],
+        cwd=_PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return completed.returncode, completed.stdout + completed.stderr
 
-def run_unit_tests():
-    """Run unit tests"""
-    print("🧪 Running Unit Tests...")
-    print("=" * 50)
 
-    # Discover and run unit tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.join(os.path.dirname(__file__), "unit")
-    suite = loader.discover(start_dir, pattern="test_*.py")
+def _suite_files(name):
+    """Return the test files of a suite from TEST_MODULES
 
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    Returns:
+        Tuple of (file paths, warning text for unlisted test files)
+    """
+    start_dir = os.path.join(os.path.dirname(__file__), name)
+    test_files = [os.path.join(start_dir, module) for module in TEST_MODULES[name]]
 
-    return result.wasSuccessful()
+    present = glob.glob(os.path.join(start_dir, "test_*.py"))
+    unlisted = sorted(set(present) - set(test_files))
+    warning = "".join(
+        f"⚠️  {path} is not listed in TEST_MODULES and was not run\n"
+        for path in unlisted
+    )
+    return test_files, warning
 
 
-def run_integration_tests():
-    """Run integration tests"""
-    print("\n🔍 Running Integration Tests...")
-    print("=" * 50)
+def _run_pytest(test_files):
+    """Run the given test files with pytest
 
-    # Discover and run integration tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.join(os.path.dirname(__file__), "integration")
-    suite = loader.discover(start_dir, pattern="test_*.py")
+    Tests are spread across CPU cores when pytest-xdist is available. Tests
+    marked ``serial`` share the live Google Sheet, so they run afterwards in
+    a second, single-process pass to avoid API contention.
 
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    Returns:
+        Tuple of (success, captured pytest output)
+    """
+    if not test_files:
+        return True, ""
 
-    return result.wasSuccessful()
+    parallel_args = _parallel_args()
+    rc_parallel, out_parallel = _pytest(
+        [*test_files, "-q", "-m", "not serial", *parallel_args]
+    )
+    serial_args = ["-n", "0"] if parallel_args else []
+    rc_serial, out_serial = _pytest([*test_files, "-q", "-m", "serial", *serial_args])
 
+    # Exit code 5 means no tests were selected, which is fine for a pass
+    success = all(
+        rc in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED)
+        for rc in (rc_parallel, rc_serial)
+    )
+    return success, out_parallel + out_serial
 
-def run_database_tests():
-    """Run database tests"""
-    print("\n🦆 Running Database Tests...")
-    print("=" * 50)
 
-    # Discover and run database tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.join(os.path.dirname(__file__), "database")
-    suite = loader.discover(start_dir, pattern="test_*.py")
+# Suite directory -> heading printed above its report
+_SUITES = {
+    "unit": "🧪 Running Unit Tests...",
+    "integration": "\n🔍 Running Integration Tests...",
+    "database": "\n🦆 Running Database Tests...",
+    "utilities": "\n🔧 Running Utilities Tests...",
+}
 
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
 
-    return result.wasSuccessful()
+def _run_suite(name):
+    """Run one suite and return (success, report) without printing"""
+    test_files, warning = _suite_files(name)
+    success, output = _run_pytest(test_files)
+    return success, f"{_SUITES[name]}\n{_BANNER_50}\n{warning}{output}"
 
 
-def run_utilities_tests():
-    """Run utilities tests"""
-    print("\n🔧 Running Utilities Tests...")
-    print("=" * 50)
+def _print_suite(name):
+    """Run one suite, print its report and return whether it passed"""
+    success, report = _run_suite(name)
+    print(report)
+    return success
 
-    # Discover and run utilities tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.join(os.path.dirname(__file__), "utilities")
-    suite = loader.discover(start_dir, pattern="test_*.py")
 
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+def run_unit_tests():
+    """Run unit tests"""
+    return _print_suite("unit")
+
+
+def run_integration_tests():
+    """Run integration tests"""
+    return _print_suite("integration")
+
 
-    return result.wasSuccessful()
+def run_database_tests():
+    """Run database tests"""
+    return _print_suite("database")
+
+
+def run_utilities_tests():
+    """Run utilities tests"""
+    return _print_suite("utilities")
 
 
 def run_all_tests():
     """Run all tests"""
     print("🚀 Starting Test Suite for Coemeta WebScraper")
-    print("=" * 60)
-
-    # Run unit tests
-    unit_success = run_unit_tests()
+    print(_BANNER_60)
 
-    # Run integration tests
-    integration_success = run_integration_tests()
+    # The suites are independent and mostly wait on the network, so run
+    # them concurrently and print their reports in a fixed order afterwards
+    with ThreadPoolExecutor(max_workers=len(_SUITES)) as executor:
+        futures = {name: executor.submit(_run_suite, name) for name in _SUITES}
+        results = {name: future.result() for name, future in futures.items()}
 
-    # Run database tests
-    database_success = run_database_tests()
+    for _, report in results.values():
+        print(report)
 
-    # Run utilities tests
-    utilities_success = run_utilities_tests()
+    unit_success = results["unit"][0]
+    integration_success = results["integration"][0]
+    database_success = results["database"][0]
+    utilities_success = results["utilities"][0]
 
     # Summary
     print("\n📊 Test Summary")
-    print("=" * 30)
+    print(_BANNER_30)
     print(f"Unit Tests: {'✅ PASSED' if unit_success else '❌ FAILED'}")
     print(f"Integration Tests: {'✅ PASSED' if integration_success else '❌ FAILED'}")
     print(f"Database Tests: {'✅ PASSED' if database_success else '❌ FAILED'}")
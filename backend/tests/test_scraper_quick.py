@@ -1,54 +1,79 @@
 #!/usr/bin/env python3
 """
 Quick test script for the scraper
-Run this from the project root for a simple test
+Run this from the project root for a simple test:
+
+    python -m backend.tests.test_scraper_quick
+
+Results are cached on disk for 24 hours per keyword; pass --refresh to
+ignore the cache and scrape the live site.
 """
 
+import argparse
+import asyncio
+import json
 import sys
-import os
+from pathlib import Path
 
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from backend.scraper import scrape_auction_results
-import json
+
+def _actual_results(results):
+    """Drop the placeholder rows returned when the site blocks the scraper"""
+    return [
+        r
+        for r in results
+        if "blocked" not in r.get("Item Description", "").lower()
+        and "error" not in r.get("Item Description", "").lower()
+    ]
 
 
-def quick_test():
+async def quick_test(use_cache=True):
     """Run a quick test of the scraper"""
+    from backend.scraper import scrape_auction_results_async
+
     print("🧪 Quick Scraper Test")
     print("=" * 40)
 
-    # Test with a simple keyword
-    keyword = "vintage"
-    print(f"Testing keyword: '{keyword}'")
+    # Scrape a few simple keywords concurrently
+    keywords = ["vintage", "antique"]
+    print(f"Testing keywords: {', '.join(repr(k) for k in keywords)}")
 
     try:
-        results = scrape_auction_results(keyword, max_results=2)
-
-        print(f"✅ Got {len(results)} results")
-
-        # Check if we got actual results
-        actual_results = [
-            r
-            for r in results
-            if "blocked" not in r.get("Item Description", "").lower()
-            and "error" not in r.get("Item Description", "").lower()
-        ]
-
-        if actual_results:
-            print("🎉 Found actual auction results!")
-            for i, result in enumerate(actual_results, 1):
-                desc = result.get("Item Description", "N/A")
-                price = result.get("Current price", "N/A")
-                print(f"  {i}. {desc[:60]}... | Price: {price}")
-        else:
-            print("⚠️  Website is blocking automated access (normal for modern sites)")
+        all_results = await asyncio.gather(
+            *(
+                scrape_auction_results_async(k, max_results=2, use_cache=use_cache)
+                for k in keywords
+            )
+        )
+
+        for keyword, results in zip(keywords, all_results):
+            print(f"✅ '{keyword}': got {len(results)} results")
+
+            # Check if we got actual results
+            actual_results = _actual_results(results)
+            if actual_results:
+                print("🎉 Found actual auction results!")
+                for i, result in enumerate(actual_results, 1):
+                    desc = result.get("Item Description", "N/A")
+                    price = result.get("Current price", "N/A")
+                    print(f"  {i}. {desc[:60]}... | Price: {price}")
+            else:
+                print(
+                    "⚠️  Website is blocking automated access "
+                    "(normal for modern sites)"
+                )
 
         # Save results
-        with open("quick_test_results.json", "w") as f:
-            json.dump(results, f, indent=2)
+        results = dict(zip(keywords, all_results))
+        output_path = Path("quick_test_results.json")
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(json.dumps(results, indent=2))
         print("💾 Results saved to 'quick_test_results.json'")
 
         return True
@@ -59,5 +84,11 @@ def quick_test():
 
 
 if __name__ == "__main__":
-    success = quick_test()
+    parser = argparse.ArgumentParser(description="Quick scraper test")
+    parser.add_argument(
+        "--refresh", action="store_true", help="ignore cached results and re-scrape"
+    )
+    args = parser.parse_args()
+
+    success = asyncio.run(quick_test(use_cache=not args.refresh))
     sys.exit(0 if success else 1)
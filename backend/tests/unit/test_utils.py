@@ -94,6 +94,11 @@ class TestUtils(unittest.TestCase):
             ("", None),
             ("$0.99", 0.99),
             ("$1,234.56", 1234.56),
+            ("1.2.3", None),
+            (None, None),
+            (42, 42.0),
+            (1e-05, 1e-05),
+            (1.5e20, 1.5e20),
         ]
 
         for input_price, expected in test_cases:
@@ -0,0 +1,72 @@
+"""Shared helpers for the Google Sheets utility tests."""
+
+from typing import Dict, List, Tuple
+from unittest.mock import MagicMock
+
+IMAGE_KEY = "Auction image / thumbnail URL (extra credit)"
+
+# Well-formed auction results, shaped like the scraper's output
+SAMPLE_AUCTION_RESULTS = [
+    {
+        "Item Description": "Gore-Tex Jacket - North Face",
+        "Current price": "$45.00",
+        "Auction end date": "2024-12-31 23:59:59",
+        IMAGE_KEY: "https://example.com/jacket.jpg",
+    },
+    {
+        "Item Description": "Vintage Rolex Watch",
+        "Current price": "$1,200.00",
+        "Auction end date": "2024-12-30 15:30:00",
+        IMAGE_KEY: "https://example.com/watch.jpg",
+    },
+    {
+        "Item Description": "Arc'teryx Beta AR Jacket",
+        "Current price": "$89.99",
+        "Auction end date": "2024-12-29 18:00:00",
+        IMAGE_KEY: "https://example.com/arcteryx.jpg",
+    },
+]
+
+RESULTS_HEADER = [
+    "Keyword",
+    "Item Description",
+    "Auction end date",
+    "Current price",
+    "Auction image / thumbnail URL (extra credit)",
+]
+
+
+def mock_sheets_client(existing_rows: List[List[str]]) -> Tuple[MagicMock, MagicMock]:
+    """Build a stand-in gspread client whose RESULTS TEMPLATE tab holds rows
+
+    Returns:
+        Tuple of (client, worksheet) mocks; assert on the worksheet calls
+    """
+    client = MagicMock()
+    worksheet = client.open_by_key.return_value.worksheet.return_value
+    worksheet.get_all_values.return_value = existing_rows
+    return client, worksheet
+
+
+class WriteBuffer:
+    """Collect results from several tests and write them in one request.
+
+    Tests enqueue (keyword, results) pairs instead of calling write_results
+    themselves; flush() sends everything to the sheet with a single
+    write_results_batch call.
+    """
+
+    def __init__(self) -> None:
+        self.pending: List[Tuple[str, List[Dict[str, str]]]] = []
+
+    def enqueue(self, keyword: str, results: List[Dict[str, str]]) -> None:
+        """Queue results to be written under the given keyword"""
+        self.pending.append((keyword, results))
+
+    def flush(self, sheet_id: str, client) -> None:
+        """Write all queued results to the sheet and clear the queue"""
+        if self.pending:
+            from backend.google_sheets import write_results_batch
+
+            write_results_batch(sheet_id, self.pending, client)
+            self.pending = []
@@ -0,0 +1,31 @@
+"""Shared fixtures for the Google Sheets utility tests."""
+
+import pytest
+
+from backend.config import get_service_account_path, get_sheet_id
+from backend.tests.utilities._fixtures import WriteBuffer
+
+
+@pytest.fixture(scope="session")
+def gs_client():
+    """Authenticated gspread client, created once per test session"""
+    from backend.google_sheets import get_gspread_client
+
+    try:
+        return get_gspread_client(get_service_account_path())
+    except Exception as e:
+        pytest.skip(f"Google Sheets client unavailable: {e}")
+
+
+@pytest.fixture(scope="session")
+def sheet_id():
+    """ID of the Google Sheet the utility tests write to"""
+    return get_sheet_id()
+
+
+@pytest.fixture(scope="session")
+def write_buffer(gs_client, sheet_id):
+    """Queue of sheet writes, flushed in one request at session teardown"""
+    buffer = WriteBuffer()
+    yield buffer
+    buffer.flush(sheet_id, gs_client)
@@ -3,20 +3,19 @@
 Simple test script to debug Google Sheets connection issues
 """
 
-import sys
+import json
 import os
 
-# Add the project root to the Python path
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
-
-import json
-from backend.google_sheets import get_gspread_client, read_keywords
+import pytest
 
 
+@pytest.mark.network
+@pytest.mark.serial
 def test_connection():
     """Test the Google Sheets connection step by step"""
+    from backend.google_sheets import get_gspread_client
+    from backend.config import get_sheet_id
+
     print("🔍 Testing Google Sheets Connection")
     print("=" * 50)
 
@@ -72,7 +71,7 @@ def test_connection():
 
     # Step 4: Test sheet access
     print("\n4. Testing sheet access...")
-    sheet_id = "1RaEyw9cb7i7gvm3wPr1OMVsJKElxlvdKBp8GgXMmMKo"
+    sheet_id = get_sheet_id()
     print(f"   Sheet ID: {sheet_id}")
 
     try:
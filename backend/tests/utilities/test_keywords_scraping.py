@@ -3,35 +3,24 @@
 Test script to scrape items using keywords from the [KEYWORDS] worksheet
 """
 
-import sys
-import os
+import pytest
 
-# Add the project root to the Python path
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
 
-from backend.google_sheets import get_gspread_client, read_keywords, write_results
-from backend.scraper import AntiDetectionScraper
-from backend.config import get_service_account_path, get_sheet_id
-import time
-
-
-def test_keywords_scraping():
+@pytest.mark.network
+@pytest.mark.serial
+def test_keywords_scraping(gs_client, sheet_id):
     """Test scraping with keywords from the [KEYWORDS] worksheet"""
+    from backend.google_sheets import read_keywords, write_results
+    from backend.scraper import AntiDetectionScraper
+
     print("🔍 Testing scraper with keywords from [KEYWORDS] worksheet")
     print("=" * 60)
 
     try:
-        # Get credentials and client
-        service_account_path = get_service_account_path()
-        sheet_id = get_sheet_id()
-        client = get_gspread_client(service_account_path)
-
         print(f"✅ Connected to Google Sheets")
 
         # Read keywords from the [KEYWORDS] worksheet
-        keywords = read_keywords(sheet_id, client)
+        keywords = read_keywords(sheet_id, gs_client)
         print(f"📋 Found {len(keywords)} keywords: {keywords}")
 
         if not keywords:
@@ -64,7 +53,7 @@ def test_keywords_scraping():
 
             # Write results to Google Sheets
             print("📊 Writing results to Google Sheets...")
-            write_results(sheet_id, test_keyword, results, client)
+            write_results(sheet_id, test_keyword, results, gs_client)
             print("✅ Results written to RESULTS TEMPLATE worksheet")
 
         else:
@@ -78,4 +67,9 @@ def test_keywords_scraping():
 
 
 if __name__ == "__main__":
-    test_keywords_scraping()
+    from backend.google_sheets import get_gspread_client
+    from backend.config import get_service_account_path, get_sheet_id
+
+    test_keywords_scraping(
+        get_gspread_client(get_service_account_path()), get_sheet_id()
+    )
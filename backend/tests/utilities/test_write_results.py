@@ -1,61 +1,58 @@
 #!/usr/bin/env python3
 """
 Test script to debug write_results function
-"""
-
-import sys
-import os
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+The Google Sheets client is mocked, so this checks the payload that
+write_results sends without any network access.
+"""
 
-from backend.google_sheets import get_gspread_client, write_results
-from backend.config import get_service_account_path, get_sheet_id
+from backend.tests.utilities._fixtures import (
+    IMAGE_KEY,
+    RESULTS_HEADER,
+    SAMPLE_AUCTION_RESULTS,
+    mock_sheets_client,
+)
 
 
 def test_write_results():
     """Test the write_results function"""
+    from backend.google_sheets import write_results
+
     print("🧪 Testing write_results function")
     print("=" * 40)
 
-    try:
-        # Get credentials and client
-        service_account_path = get_service_account_path()
-        sheet_id = get_sheet_id()
-        client = get_gspread_client(service_account_path)
-
-        print(f"✅ Connected to Google Sheets")
-        print(f"📊 Sheet ID: {sheet_id}")
+    client, worksheet = mock_sheets_client([RESULTS_HEADER])
 
-        # Test data
-        test_results = [
-            {
-                "Item Description": "Test Item 1 - Gore Tex Jacket",
-                "Current price": "$45.00",
-                "Auction end date": "2024-12-31",
-                "Auction image / thumbnail URL (extra credit)": "http://example.com/image1.jpg",
-            },
-            {
-                "Item Description": "Test Item 2 - Vintage Watch",
-                "Current price": "$120.00",
-                "Auction end date": "2024-12-30",
-                "Auction image / thumbnail URL (extra credit)": "http://example.com/image2.jpg",
-            },
-        ]
-
-        print(f"📝 Writing {len(test_results)} test results...")
+    # Test data
+    test_results = SAMPLE_AUCTION_RESULTS
 
-        # Write test results
-        write_results(sheet_id, "test-keyword", test_results, client)
+    print(f"📝 Writing {len(test_results)} test results...")
 
-        print("✅ Successfully wrote test results to RESULTS TEMPLATE")
-        print("📋 Check your Google Sheet to see the results!")
+    # Write test results
+    write_results("sheet-id", "test-keyword", test_results, client)
 
-    except Exception as e:
-        print(f"❌ Error testing write_results: {e}")
-        import traceback
-
-        traceback.print_exc()
+    # All rows, with images as IMAGE formulas, go out in a single request
+    worksheet.batch_update.assert_called_once_with(
+        [
+            {
+                "range": "A2",
+                "values": [
+                    [
+                        "test-keyword",
+                        result["Item Description"],
+                        result["Auction end date"],
+                        result["Current price"],
+                        f'=IMAGE("{result[IMAGE_KEY]}", 3, 100, 100)',
+                    ]
+                    for result in test_results
+                ],
+            }
+        ],
+        value_input_option="USER_ENTERED",
+    )
+    worksheet.update.assert_not_called()
+    worksheet.update_cell.assert_not_called()
+    print("✅ write_results sent the expected rows")
 
 
 if __name__ == "__main__":
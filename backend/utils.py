@@ -18,6 +18,7 @@ Example:
     >>> cleaned = clean_text("  This   is   dirty   text  ")
 """
 
+import functools
 import logging
 import re
 import time
@@ -60,6 +61,7 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
     return logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_keyword(keyword: str) -> str:
     """Sanitize a keyword for use in URLs and search queries.
 
@@ -117,17 +119,23 @@ def validate_url(url: str) -> bool:
         return False
 
 
-def extract_price(price_text: str) -> Optional[float]:
+# Characters stripped from price text before converting it to a number
+PRICE_STRIP_RE = re.compile(r"[^\d.]")
+
+
+def extract_price(price_text: Union[str, float, None]) -> Optional[float]:
     """Extract numeric price from price text.
 
     Parses a string containing a price and extracts the numeric value,
     removing currency symbols and other non-numeric characters. This
     function handles various price formats including those with currency
-    symbols, commas, and other decorations.
+    symbols, commas, and other decorations. It never raises, so callers
+    can test the result against None instead of wrapping it in try/except.
 
     Args:
         price_text: Price text to parse.
             Can be in various formats (e.g., "$123.45", "123.45", "123", "£100").
+            Numbers are accepted as-is.
 
     Returns:
         Optional[float]: Extracted price as a float if successful,
@@ -146,15 +154,22 @@ def extract_price(price_text: str) -> Optional[float]:
     if not price_text:
         return None
 
+    # Numbers are already prices; str() could give scientific notation,
+    # which stripping non-digits would mangle
+    if isinstance(price_text, (int, float)):
+        return float(price_text)
+
     # Remove currency symbols and extra characters
-    cleaned = re.sub(r"[^\d.]", "", price_text.strip())
+    cleaned = PRICE_STRIP_RE.sub("", price_text)
 
-    try:
-        return float(cleaned) if cleaned else None
-    except ValueError:
+    # Guard the float() call rather than catching its error: after cleaning,
+    # only stray dots ("1.2.3", ".") can make the text unparseable
+    if not cleaned or cleaned.count(".") > 1 or not cleaned.strip("."):
         return None
+    return float(cleaned)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date(date_text: str) -> str:
     """Format date text to a consistent format.
 
@@ -225,6 +240,7 @@ def validate_auction_data(data: Dict[str, Any]) -> bool:
     return all(field in data for field in required_fields)
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_text(text: str) -> str:
     """Clean and normalize text content.
 
@@ -21,12 +21,25 @@ Typical usage:
 
 import streamlit as st
 import pandas as pd
-import time
 from datetime import datetime
+from functools import lru_cache, partial
+import io
+import logging
 import os
-from typing import Dict, List, Optional, Any, Union, Tuple
-
-from backend.google_sheets import get_gspread_client, write_results, read_keywords
+import queue
+import re
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Any, Union, Tuple
+
+from backend.google_sheets import (
+    get_gspread_client,
+    write_results,
+    write_results_batch,
+    read_keywords,
+)
 from backend.scraper import scrape_auction_results
 from backend.database.database import get_database, close_database
 from backend.utils import (
@@ -37,6 +50,7 @@ from backend.utils import (
     validate_auction_data,
     extract_price,
     format_date,
+    PRICE_STRIP_RE,
 )
 from backend.config import get_config
 from backend.error_handling import (
@@ -54,9 +68,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Enhanced Custom CSS for modern styling
-st.markdown(
-    """
+# Enhanced Custom CSS for modern styling. Theme colors live in
+# .streamlit/config.toml; this covers the custom components.
+APP_CSS = """
 <style>
     /* Global Styles */
     .main {
@@ -251,11 +265,334 @@ st.markdown(
         }
     }
 </style>
-""",
-    unsafe_allow_html=True,
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def minified_css() -> str:
+    """Return APP_CSS without comments and redundant whitespace.
+
+    Streamlit rebuilds the page on every rerun, so the stylesheet has to be
+    sent each time; minifying it once per process keeps that payload small.
+
+    Returns:
+        str: The minified ``<style>`` block
+    """
+    css = re.sub(r"/\*.*?\*/", "", APP_CSS, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
+
+
+st.markdown(minified_css(), unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner=False)
+def app_logger() -> logging.Logger:
+    """Configure logging once per server process.
+
+    setup_logging attaches file and console handlers; running it on every
+    rerun would redo that work on each interaction.
+
+    Returns:
+        logging.Logger: The configured application logger
+    """
+    return setup_logging(get_config().LOG_LEVEL)
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_gspread_client(service_account_path: str):
+    """Return a gspread client shared across reruns and sessions.
+
+    Streamlit reruns the whole script on every interaction; caching the
+    client avoids re-authenticating with Google on each button press.
+
+    Args:
+        service_account_path: Path to the service account JSON file
+
+    Returns:
+        gspread.Client: Authenticated Google Sheets client
+    """
+    return get_gspread_client(service_account_path)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_read_keywords(sheet_id: str, _client) -> List[str]:
+    """Read the keywords worksheet, reusing the result for five minutes.
+
+    The leading underscore on ``_client`` keeps Streamlit from hashing the
+    client, so the cache is keyed on ``sheet_id`` alone.
+
+    Args:
+        sheet_id: Google Sheet ID to read keywords from
+        _client: Authenticated gspread client
+
+    Returns:
+        List[str]: Keywords found in the sheet
+    """
+    return read_keywords(sheet_id, _client)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def results_to_frame(results: List[Dict[str, str]]) -> pd.DataFrame:
+    """Build a DataFrame from scraped results, reused across reruns.
+
+    Args:
+        results: List of auction result dictionaries
+
+    Returns:
+        pd.DataFrame: One row per result
+    """
+    return pd.DataFrame(results)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def results_to_csv(results: List[Dict[str, str]]) -> bytes:
+    """Serialize scraped results to CSV bytes, reused across reruns.
+
+    pyarrow's CSV writer encodes straight into a bytes buffer, skipping the
+    intermediate ``str`` that ``DataFrame.to_csv`` would build.
+
+    Args:
+        results: List of auction result dictionaries
+
+    Returns:
+        bytes: UTF-8 encoded CSV suitable for st.download_button
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    table = pa.Table.from_pandas(results_to_frame(results), preserve_index=False)
+    buffer = io.BytesIO()
+    pacsv.write_csv(table, buffer)
+    return buffer.getvalue()
+
+
+def parse_prices(df: pd.DataFrame) -> pd.Series:
+    """Parse the 'Current price' column of a results frame into floats.
+
+    Applies the same cleaning as extract_price to the whole column at once.
+    Missing, unparseable and zero prices are dropped.
+
+    Args:
+        df: Results DataFrame, as built by results_to_frame
+
+    Returns:
+        pd.Series: Positive prices as floats
+    """
+    if "Current price" not in df:
+        return pd.Series(dtype=float)
+    prices = pd.to_numeric(
+        df["Current price"].astype(str).str.replace(PRICE_STRIP_RE, "", regex=True),
+        errors="coerce",
+    )
+    # NaN > 0 is False, so this also drops unparseable prices
+    return prices[prices > 0]
+
+
+# Results Viewer price filter options and their [low, high) bounds
+PRICE_BUCKETS = {
+    "Under $50": (0, 50),
+    "$50-$100": (50, 100),
+    "$100-$500": (100, 500),
+    "Over $500": (500, float("inf")),
+}
+
+
+def filter_by_price(df: pd.DataFrame, bucket: str) -> pd.DataFrame:
+    """Keep the results whose price falls in one of PRICE_BUCKETS.
+
+    Args:
+        df: Results DataFrame, as built by results_to_frame
+        bucket: Key of PRICE_BUCKETS to filter by
+
+    Returns:
+        pd.DataFrame: Matching rows; rows without a usable price are dropped
+    """
+    low, high = PRICE_BUCKETS[bucket]
+    prices = parse_prices(df)
+    return df.loc[prices.index[(prices >= low) & (prices < high)]]
+
+
+def summarize_keywords(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Count results and average their prices per keyword in one groupby.
+
+    Args:
+        chunks: Per-keyword results frames, each with a 'Keyword' column
+
+    Returns:
+        pd.DataFrame: Indexed by keyword in first-seen order, with columns
+        'results' and 'avg_price' (NaN when no result had a usable price)
+    """
+    all_df = pd.concat(chunks, ignore_index=True)
+    # Unusable prices are absent from parse_prices and become NaN here,
+    # so they are counted as results but left out of the mean
+    all_df["_price"] = parse_prices(all_df)
+    return all_df.groupby("Keyword", sort=False).agg(
+        results=("_price", "size"), avg_price=("_price", "mean")
+    )
+
+
+def summary_cards(chunks: List[pd.DataFrame]) -> List[str]:
+    """Render one search card per keyword from the scraped results.
+
+    Args:
+        chunks: Per-keyword results frames, each with a 'Keyword' column
+
+    Returns:
+        List[str]: Card HTML in the order the keywords finished
+    """
+    if not chunks:
+        return []
+    summary = summarize_keywords(chunks)
+    return [
+        create_search_card(keyword, int(count), None if pd.isna(avg) else float(avg))
+        for keyword, count, avg in zip(
+            summary.index, summary["results"], summary["avg_price"]
+        )
+    ]
+
+
+def scrape_keywords_concurrently(
+    keywords: List[str], max_results: int
+) -> Iterator[Tuple[str, Future]]:
+    """Scrape several keywords in parallel, yielding each as it finishes.
+
+    Scraping is network-bound, so keywords are scraped in a thread pool of
+    at most ``SCRAPER_MAX_WORKERS`` threads. Each worker thread gets its own
+    scraper, and so its own HTTP sessions and browser, which is why the pool
+    is kept small. Streamlit calls must stay on the script thread, so
+    callers update the UI from the yielded futures.
+
+    Closing the generator early cancels the keywords that have not started;
+    callers should close it when they stop consuming, e.g. in a finally.
+
+    Args:
+        keywords: Keywords to scrape
+        max_results: Maximum number of results per keyword
+
+    Yields:
+        Tuple[str, Future]: The keyword and its completed future; calling
+            ``result()`` returns the scraped results or raises the scrape error
+    """
+    max_workers = max(1, min(get_config().SCRAPER_MAX_WORKERS, len(keywords)))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(scrape_auction_results, keyword, max_results): keyword
+            for keyword in keywords
+        }
+        for future in as_completed(futures):
+            yield futures[future], future
+    finally:
+        # A rerun or Stop closes this generator mid-batch; drop the queued
+        # keywords instead of blocking the script until they are scraped
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Number of log entries kept per session and shown in the logs panel
+MAX_LOG_ENTRIES = 500
+DISPLAYED_LOG_ENTRIES = 20
+
+
+class BatchResultWriter:
+    """Write scraped results to Google Sheets and DuckDB in the background.
+
+    Results are queued with put() as each keyword finishes. A writer thread
+    drains the queue and sends up to ``batch_size`` keywords at a time with
+    one write_results_batch call and one insert_auction_results_bulk call,
+    so writes overlap with the scrapes that are still running. The thread
+    never touches Streamlit; errors are collected and returned by close().
+
+    Args:
+        sheet_id: Google Sheet ID to write results to
+        client: Authenticated gspread client
+        db: Database to insert results into
+        batch_size: Maximum number of keywords per write
+    """
+
+    _STOP = object()
+
+    def __init__(self, sheet_id: str, client, db, batch_size: int = 10) -> None:
+        self.sheet_id = sheet_id
+        self.client = client
+        self.db = db
+        self.batch_size = batch_size
+        self.saved_count = 0
+        self.errors: List[str] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, keyword: str, results: List[Dict[str, str]]) -> None:
+        """Queue one keyword's results for writing."""
+        self._queue.put((keyword, results))
+
+    def close(self) -> Tuple[int, List[str]]:
+        """Flush queued results and stop the writer thread.
+
+        Returns:
+            Tuple[int, List[str]]: Number of results saved to the database
+                and any write error messages
+        """
+        self._queue.put(self._STOP)
+        self._thread.join()
+        return self.saved_count, self.errors
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._queue.get()
+            # Take whatever else is already queued, up to batch_size
+            while item is not self._STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            stopping = item is self._STOP
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[str, List[Dict[str, str]]]]) -> None:
+        try:
+            write_results_batch(self.sheet_id, batch, self.client)
+        except Exception as e:
+            self.errors.append(f"Could not write to Google Sheets: {str(e)}")
+        try:
+            self.saved_count += self.db.insert_auction_results_bulk(batch)
+        except Exception as e:
+            self.errors.append(f"Database save failed: {str(e)}")
+
+
+# Markup for the styled status messages; the classes are defined in APP_CSS
+_MESSAGE_TEMPLATE = (
+    '<div class="{kind}-message">'
+    '<h4 style="margin: 0;">{title}</h4>'
+    '<p style="margin: 0.5rem 0 0 0;">{body}</p>'
+    "</div>"
 )
 
 
+def show_message(kind: str, title: str, body: str) -> None:
+    """Render a styled status message.
+
+    Args:
+        kind: Message style: "success", "warning", "error" or "info"
+        title: Heading shown in the message
+        body: Message text
+
+    Returns:
+        None
+    """
+    st.markdown(
+        _MESSAGE_TEMPLATE.format_map({"kind": kind, "title": title, "body": body}),
+        unsafe_allow_html=True,
+    )
+
+
 def initialize_session_state() -> None:
     """Initialize session state variables for the application.
 
@@ -263,20 +600,21 @@ def initialize_session_state() -> None:
     creating the necessary session state variables if they don't already exist.
 
     Session state variables:
-        - results_data: List of dictionaries containing scraped auction results
+        - results_df: DataFrame of the latest scraped auction results
         - processing_status: Current processing status (idle, searching, batch_processing)
-        - logs: List of log messages with timestamps
+        - logs: Deque of the latest (level, message, timestamp) log entries
         - stats: Dictionary containing statistics about searches and results
 
     Returns:
         None
     """
-    if "results_data" not in st.session_state:
-        st.session_state.results_data = []
+    if "results_df" not in st.session_state:
+        st.session_state.results_df = pd.DataFrame()
     if "processing_status" not in st.session_state:
         st.session_state.processing_status = "idle"
     if "logs" not in st.session_state:
-        st.session_state.logs = []
+        # Bounded so long sessions don't accumulate logs without limit
+        st.session_state.logs = deque(maxlen=MAX_LOG_ENTRIES)
     if "stats" not in st.session_state:
         st.session_state.stats = {
             "total_searches": 0,
@@ -289,8 +627,8 @@ def initialize_session_state() -> None:
 def log_message(message: str, level: str = "INFO") -> None:
     """Add a message to the application logs with timestamp.
 
-    This function appends a formatted log message to the session state logs
-    with a timestamp and specified log level.
+    This function appends a (level, message, timestamp) entry to the session
+    state logs; display_logs formats it when rendering.
 
     Args:
         message: The message text to log
@@ -303,9 +641,60 @@ def log_message(message: str, level: str = "INFO") -> None:
         log_message("Search completed successfully", "SUCCESS")
     """
     timestamp = datetime.now().strftime("%H:%M:%S")
-    st.session_state.logs.append(f"[{timestamp}] {level}: {message}")
+    st.session_state.logs.append((level, message, timestamp))
+
+
+def record_search_stats(successful: int, failed: int, results: int) -> None:
+    """Add the outcome of a batch of searches to the session statistics.
+
+    Batch loops count locally and call this once at the end, rather than
+    updating session state for every keyword.
+
+    Args:
+        successful: Number of keywords that returned results
+        failed: Number of keywords that returned nothing or errored
+        results: Total number of results found
+
+    Returns:
+        None
+    """
+    stats = st.session_state.stats
+    stats["successful_searches"] += successful
+    stats["failed_searches"] += failed
+    stats["total_results"] += results
+
+
+@st.fragment
+def quick_stats_panel() -> None:
+    """Display result count and price statistics for the current results.
+
+    Runs as a fragment so it can be refreshed without rerunning the whole
+    app.
+
+    Returns:
+        None
+    """
+    df = st.session_state.results_df
+    if not df.empty:
+        st.metric("Total Results", len(df))
+
+        # Calculate average price if available
+        prices = parse_prices(df)
+        if not prices.empty:
+            st.metric("Average Price", f"${prices.mean():.2f}")
+            st.metric("Price Range", f"${prices.min():.2f} - ${prices.max():.2f}")
+
+
+# Streamlit element used to render each log level; unknown levels use st.info
+_LOG_RENDERERS = {
+    "ERROR": st.error,
+    "WARNING": st.warning,
+    "SUCCESS": st.success,
+    "INFO": st.info,
+}
 
 
+@st.fragment
 def display_logs() -> None:
     """Display application logs in a scrollable container with appropriate styling.
 
@@ -319,17 +708,25 @@ def display_logs() -> None:
         with st.expander("📋 Activity Logs", expanded=False):
             log_container = st.container()
             with log_container:
-                for log in st.session_state.logs[-20:]:  # Show last 20 logs
-                    if "ERROR" in log:
-                        st.error(log)
-                    elif "WARNING" in log:
-                        st.warning(log)
-                    elif "SUCCESS" in log:
-                        st.success(log)
-                    else:
-                        st.info(log)
+                # Show the most recent logs, oldest first, without copying
+                # the whole deque
+                recent = islice(reversed(st.session_state.logs), DISPLAYED_LOG_ENTRIES)
+                for level, message, timestamp in reversed(list(recent)):
+                    render = _LOG_RENDERERS.get(level, st.info)
+                    render(f"[{timestamp}] {level}: {message}")
+
+
+# Markup for the statistics cards at the top of the page
+_METRIC_CARD_TEMPLATE = (
+    '<div class="metric-card">'
+    '<h3 style="margin: 0; color: {color};">{icon}</h3>'
+    '<h2 style="margin: 0.5rem 0; color: #333;">{value}</h2>'
+    '<p style="margin: 0; color: #666;">{label}</p>'
+    "</div>"
+)
 
 
+@st.fragment
 def display_stats() -> None:
     """Display application statistics in a beautiful card layout.
 
@@ -348,57 +745,23 @@ def display_stats() -> None:
     """
     stats = st.session_state.stats
 
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.markdown(
-            f"""
-            <div class="metric-card">
-                <h3 style="margin: 0; color: #667eea;">🔍</h3>
-                <h2 style="margin: 0.5rem 0; color: #333;">{stats['total_searches']}</h2>
-                <p style="margin: 0; color: #666;">Total Searches</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with col2:
-        st.markdown(
-            f"""
-            <div class="metric-card">
-                <h3 style="margin: 0; color: #4CAF50;">📊</h3>
-                <h2 style="margin: 0.5rem 0; color: #333;">{stats['total_results']}</h2>
-                <p style="margin: 0; color: #666;">Total Results</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with col3:
-        st.markdown(
-            f"""
-            <div class="metric-card">
-                <h3 style="margin: 0; color: #2196F3;">✅</h3>
-                <h2 style="margin: 0.5rem 0; color: #333;">{stats['successful_searches']}</h2>
-                <p style="margin: 0; color: #666;">Successful</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with col4:
-        st.markdown(
-            f"""
-            <div class="metric-card">
-                <h3 style="margin: 0; color: #f44336;">❌</h3>
-                <h2 style="margin: 0.5rem 0; color: #333;">{stats['failed_searches']}</h2>
-                <p style="margin: 0; color: #666;">Failed</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    cards = [
+        ("🔍", "#667eea", stats["total_searches"], "Total Searches"),
+        ("📊", "#4CAF50", stats["total_results"], "Total Results"),
+        ("✅", "#2196F3", stats["successful_searches"], "Successful"),
+        ("❌", "#f44336", stats["failed_searches"], "Failed"),
+    ]
+    for col, (icon, color, value, label) in zip(st.columns(4), cards):
+        with col:
+            st.markdown(
+                _METRIC_CARD_TEMPLATE.format_map(
+                    {"icon": icon, "color": color, "value": value, "label": label}
+                ),
+                unsafe_allow_html=True,
+            )
 
 
+@lru_cache(maxsize=1024)
 def create_search_card(
     keyword: str, results_count: int, avg_price: Optional[float] = None
 ) -> str:
@@ -406,43 +769,352 @@ def create_search_card(
 
     This function generates HTML for a styled card that displays information
     about a search result, including the keyword, number of results found,
-    and optionally the average price.
+    and optionally the average price. The output depends only on the
+    arguments, so rendered cards are cached; pass None rather than NaN for
+    a missing average so equal calls hit the cache.
 
     Args:
         keyword: The search keyword
         results_count: Number of results found for this keyword
         avg_price: Optional average price of results, if available
 
-    Returns:
-        str: HTML string for the search result card
+    Returns:
+        str: HTML string for the search result card
+
+    Example:
+        card_html = create_search_card("vintage watch", 15, 125.50)
+        st.markdown(card_html, unsafe_allow_html=True)
+    """
+    card_html = f"""
+    <div class="metric-card" style="margin: 1rem 0;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div>
+                <h3 style="margin: 0; color: #333;">🔍 {keyword}</h3>
+                <p style="margin: 0.5rem 0; color: #666;">Found {results_count} results</p>
+            </div>
+            <div style="text-align: right;">
+                <h4 style="margin: 0; color: #4CAF50;">{results_count}</h4>
+                <p style="margin: 0; color: #666;">items</p>
+            </div>
+        </div>
+    """
+
+    if avg_price:
+        card_html += f"""
+        <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid #eee;">
+            <p style="margin: 0; color: #666;">Average Price: <strong style="color: #4CAF50;">${avg_price:.2f}</strong></p>
+        </div>
+        """
+
+    card_html += "</div>"
+    return card_html
+
+
+@st.fragment
+def results_viewer_tab() -> None:
+    """Render the Results Viewer tab.
+
+    Runs as a fragment so filtering the results only reruns this tab.
+
+    Returns:
+        None
+    """
+    st.markdown(
+        """
+        <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 15px; 
+                    box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 2rem;">
+            <h2 style="margin: 0 0 1rem 0; color: #333;">📊 Results Viewer</h2>
+            <p style="margin: 0; color: #666;">View and analyze your scraped auction data</p>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    if not st.session_state.results_df.empty:
+        show_message(
+            "info",
+            "📊 Current Results",
+            f"{len(st.session_state.results_df)} items available for analysis",
+        )
+
+        # Enhanced filter options
+        col1, col2 = st.columns([1, 1])
+
+        with col1:
+            price_filter = st.selectbox(
+                "Filter by Price",
+                ["All", *PRICE_BUCKETS],
+            )
+
+        with col2:
+            search_filter = st.text_input("Search in descriptions", "")
+
+        # Apply filters
+        df = st.session_state.results_df
+
+        if price_filter != "All":
+            df = filter_by_price(df, price_filter)
+
+        if search_filter and "Item Description" in df:
+            matches = df["Item Description"].str.contains(
+                search_filter, case=False, na=False, regex=False
+            )
+            df = df[matches]
+
+        # Display filtered results
+        if not df.empty:
+            st.markdown("### 📋 Filtered Results")
+            st.dataframe(df, use_container_width=True)
+
+            # Enhanced summary statistics
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Total Items", len(df))
+            with col2:
+                unique_keywords = df["Keyword"].nunique() if "Keyword" in df else 1
+                st.metric("Unique Keywords", unique_keywords)
+            with col3:
+                # Calculate average price
+                prices = parse_prices(df)
+                avg_price = "N/A" if prices.empty else f"${prices.mean():.2f}"
+                st.metric("Average Price", avg_price)
+            with col4:
+                st.metric("Filtered Items", len(df))
+        else:
+            show_message(
+                "warning",
+                "⚠️ No Matching Results",
+                "No results match the current filters",
+            )
+    else:
+        show_message(
+            "info",
+            "📊 No Results Available",
+            "Run a search first to see results here!",
+        )
+
+
+@st.fragment
+def database_analytics_tab() -> None:
+    """Render the Database Analytics tab.
+
+    Runs as a fragment so its widgets, such as the look-back slider, only
+    rerun this tab.
+
+    Returns:
+        None
+    """
+    st.markdown(
+        """
+        <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 15px; 
+                    box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 2rem;">
+            <h2 style="margin: 0 0 1rem 0; color: #333;">🦆 Database Analytics</h2>
+            <p style="margin: 0; color: #666;">Analyze stored auction data and generate insights</p>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    try:
+        db = get_database()
+
+        # Database Overview
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            stats = db.get_database_stats()
+            st.metric("Total Records", stats.get("total_records", 0))
+
+        with col2:
+            st.metric("Unique Keywords", stats.get("unique_keywords", 0))
+
+        with col3:
+            avg_price = stats.get("avg_price", 0)
+            st.metric("Avg Price", f"${avg_price:.2f}" if avg_price else "N/A")
+
+        with col4:
+            median_price = stats.get("median_price", 0)
+            st.metric("Median Price", f"${median_price:.2f}" if median_price else "N/A")
+
+        # Analytics Sections
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.subheader("📊 Keyword Statistics")
+            keyword_stats = db.get_keyword_stats()
+            if not keyword_stats.empty:
+                st.dataframe(keyword_stats, use_container_width=True)
+            else:
+                st.info(
+                    "No keyword data available yet. Run some searches to populate the database."
+                )
+
+        with col2:
+            st.subheader("🔍 Quick Search")
+            search_term = st.text_input("Search items by description")
+            if search_term:
+                results = db.search_items(
+                    search_term,
+                    limit=10,
+                    as_arrow=True,
+                    columns=("keyword", "item_description", "current_price"),
+                )
+                if results.num_rows:
+                    st.dataframe(results, use_container_width=True)
+                else:
+                    st.info("No items found matching your search.")
+
+        # Price Analytics
+        st.subheader("💰 Price Analytics")
+        price_stats = db.get_price_analytics()
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Min Price", f"${price_stats.get('min_price', 0):.2f}")
+        with col2:
+            st.metric("Max Price", f"${price_stats.get('max_price', 0):.2f}")
+        with col3:
+            st.metric("Total Items", price_stats.get("total_items", 0))
+
+        # Recent Activity
+        st.subheader("⏰ Recent Activity")
+        hours = st.slider("Hours to look back", 1, 168, 24)
+        recent_results = db.get_recent_results(
+            hours,
+            as_arrow=True,
+            columns=("keyword", "item_description", "current_price", "scraped_at"),
+        )
+
+        if recent_results.num_rows:
+            st.dataframe(recent_results, use_container_width=True)
+        else:
+            st.info(f"No activity in the last {hours} hours.")
+
+        # Export Options
+        st.subheader("📤 Export Data")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if st.button("Export All Data to CSV"):
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"auction_data_export_{timestamp}.csv"
+                db.export_to_csv(filename)
+                st.success(f"Data exported to {filename}")
+
+        with col2:
+            keyword_filter = st.text_input("Filter by keyword for export")
+            if keyword_filter and st.button("Export Filtered Data"):
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"auction_data_{keyword_filter}_{timestamp}.csv"
+                db.export_to_csv(filename, keyword=keyword_filter)
+                st.success(f"Filtered data exported to {filename}")
+
+    except Exception as e:
+        st.error(f"Database error: {str(e)}")
+        st.info("Make sure DuckDB is installed: pip install duckdb")
+
+
+@st.fragment
+def utilities_tab() -> None:
+    """Render the Utilities tab.
+
+    Runs as a fragment so trying out a utility only reruns this tab.
+
+    Returns:
+        None
+    """
+    st.markdown(
+        """
+        <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 15px; 
+                    box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 2rem;">
+            <h2 style="margin: 0 0 1rem 0; color: #333;">🛠️ Utilities</h2>
+            <p style="margin: 0; color: #666;">Test and validate data processing functions</p>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(
+            """
+            <div style="background: rgba(255, 255, 255, 0.95); padding: 1.5rem; border-radius: 15px; 
+                        box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h3 style="margin: 0 0 1rem 0; color: #333;">🧹 Text Processing</h3>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+        test_text = st.text_input("Test text cleaning", "  This   is   dirty   text  ")
+        if st.button("Clean Text", use_container_width=True):
+            cleaned = clean_text(test_text)
+            st.markdown(
+                f"""
+                <div class="metric-card">
+                    <h4 style="margin: 0 0 0.5rem 0; color: #333;">Text Cleaning Results</h4>
+                    <p style="margin: 0; color: #666;"><strong>Original:</strong> <code>{test_text}</code></p>
+                    <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Cleaned:</strong> <code>{cleaned}</code></p>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+
+        test_keyword = st.text_input(
+            "Test keyword sanitization", "  Gore-Tex  Jacket  "
+        )
+        if st.button("Sanitize Keyword", use_container_width=True):
+            sanitized = sanitize_keyword(test_keyword)
+            st.markdown(
+                f"""
+                <div class="metric-card">
+                    <h4 style="margin: 0 0 0.5rem 0; color: #333;">Keyword Sanitization Results</h4>
+                    <p style="margin: 0; color: #666;"><strong>Original:</strong> <code>{test_keyword}</code></p>
+                    <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Sanitized:</strong> <code>{sanitized}</code></p>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
 
-    Example:
-        card_html = create_search_card("vintage watch", 15, 125.50)
-        st.markdown(card_html, unsafe_allow_html=True)
-    """
-    card_html = f"""
-    <div class="metric-card" style="margin: 1rem 0;">
-        <div style="display: flex; justify-content: space-between; align-items: center;">
-            <div>
-                <h3 style="margin: 0; color: #333;">🔍 {keyword}</h3>
-                <p style="margin: 0.5rem 0; color: #666;">Found {results_count} results</p>
-            </div>
-            <div style="text-align: right;">
-                <h4 style="margin: 0; color: #4CAF50;">{results_count}</h4>
-                <p style="margin: 0; color: #666;">items</p>
+    with col2:
+        st.markdown(
+            """
+            <div style="background: rgba(255, 255, 255, 0.95); padding: 1.5rem; border-radius: 15px; 
+                        box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h3 style="margin: 0 0 1rem 0; color: #333;">✅ Data Validation</h3>
             </div>
-        </div>
-    """
+            """,
+            unsafe_allow_html=True,
+        )
 
-    if avg_price:
-        card_html += f"""
-        <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid #eee;">
-            <p style="margin: 0; color: #666;">Average Price: <strong style="color: #4CAF50;">${avg_price:.2f}</strong></p>
-        </div>
-        """
+        test_price = st.text_input("Test price extraction", "$123.45")
+        if st.button("Extract Price", use_container_width=True):
+            extracted = extract_price(test_price)
+            st.markdown(
+                f"""
+                <div class="metric-card">
+                    <h4 style="margin: 0 0 0.5rem 0; color: #333;">Price Extraction Results</h4>
+                    <p style="margin: 0; color: #666;"><strong>Input:</strong> <code>{test_price}</code></p>
+                    <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Extracted:</strong> <code>{extracted}</code></p>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
 
-    card_html += "</div>"
-    return card_html
+        test_date = st.text_input("Test date formatting", "  Dec 15, 2024  ")
+        if st.button("Format Date", use_container_width=True):
+            formatted = format_date(test_date)
+            st.markdown(
+                f"""
+                <div class="metric-card">
+                    <h4 style="margin: 0 0 0.5rem 0; color: #333;">Date Formatting Results</h4>
+                    <p style="margin: 0; color: #666;"><strong>Input:</strong> <code>{test_date}</code></p>
+                    <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Formatted:</strong> <code>{formatted}</code></p>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
 
 
 def main() -> None:
@@ -462,6 +1134,8 @@ def main() -> None:
     Returns:
         None
     """
+    app_logger()
+
     # Enhanced header with gradient background
     st.markdown(
         """
@@ -491,7 +1165,7 @@ def main() -> None:
         st.subheader("📊 Google Sheets")
         sheet_id = st.text_input(
             "Sheet ID",
-            value="1RaEyw9cb7i7gvm3wPr1OMVsJKElxlvdKBp8GgXMmMKo",
+            value=get_config().SHEET_ID,
             help="The Google Sheet ID where keywords are stored and results will be written",
         )
 
@@ -515,30 +1189,18 @@ def main() -> None:
         if st.button("🔗 Test Connection", use_container_width=True):
             with st.spinner("Testing connection..."):
                 try:
-                    client = get_gspread_client(service_account_path)
-                    keywords = read_keywords(sheet_id, client)
-                    st.markdown(
-                        f"""
-                        <div class="success-message">
-                            <h4 style="margin: 0;">✅ Connection Successful!</h4>
-                            <p style="margin: 0.5rem 0 0 0;">Found {len(keywords)} keywords in the sheet</p>
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
+                    client = _cached_gspread_client(service_account_path)
+                    keywords = _cached_read_keywords(sheet_id, client)
+                    show_message(
+                        "success",
+                        "✅ Connection Successful!",
+                        f"Found {len(keywords)} keywords in the sheet",
                     )
                     log_message(
                         f"Successfully connected to Google Sheets. Found {len(keywords)} keywords"
                     )
                 except Exception as e:
-                    st.markdown(
-                        f"""
-                        <div class="error-message">
-                            <h4 style="margin: 0;">❌ Connection Failed</h4>
-                            <p style="margin: 0.5rem 0 0 0;">{str(e)}</p>
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
-                    )
+                    show_message("error", "❌ Connection Failed", str(e))
                     log_message(f"Google Sheets connection failed: {str(e)}", "ERROR")
 
     # Display statistics
@@ -570,18 +1232,18 @@ def main() -> None:
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            keyword = st.text_input(
-                "Enter keyword to search",
-                placeholder="e.g., gore-tex, vintage watch, etc.",
-                help="Enter a keyword to search for auction items",
-            )
+            # A form so typing the keyword doesn't rerun the app until Search
+            with st.form("search_form", border=False):
+                keyword = st.text_input(
+                    "Enter keyword to search",
+                    placeholder="e.g., gore-tex, vintage watch, etc.",
+                    help="Enter a keyword to search for auction items",
+                )
+                submitted = st.form_submit_button(
+                    "🔍 Search", type="primary", use_container_width=True
+                )
 
-            if st.button(
-                "🔍 Search",
-                type="primary",
-                disabled=not keyword,
-                use_container_width=True,
-            ):
+            if submitted:
                 if keyword:
                     st.session_state.processing_status = "searching"
                     st.session_state.stats["total_searches"] += 1
@@ -591,18 +1253,16 @@ def main() -> None:
                             results = scrape_auction_results(keyword, max_results)
 
                             if results:
-                                st.session_state.results_data = results
+                                st.session_state.results_df = results_to_frame(
+                                    results
+                                )
                                 st.session_state.stats["total_results"] += len(results)
                                 st.session_state.stats["successful_searches"] += 1
 
-                                st.markdown(
-                                    f"""
-                                    <div class="success-message">
-                                        <h4 style="margin: 0;">✅ Search Complete!</h4>
-                                        <p style="margin: 0.5rem 0 0 0;">Found {len(results)} results for '{keyword}'</p>
-                                    </div>
-                                    """,
-                                    unsafe_allow_html=True,
+                                show_message(
+                                    "success",
+                                    "✅ Search Complete!",
+                                    f"Found {len(results)} results for '{keyword}'",
                                 )
                                 log_message(
                                     f"Found {len(results)} results for keyword: {keyword}"
@@ -610,7 +1270,9 @@ def main() -> None:
 
                                 # Write results to Google Sheets
                                 try:
-                                    client = get_gspread_client(service_account_path)
+                                    client = _cached_gspread_client(
+                                        service_account_path
+                                    )
                                     write_results(sheet_id, keyword, results, client)
                                     st.success(
                                         f"📊 Written {len(results)} results to Google Sheets"
@@ -649,7 +1311,7 @@ def main() -> None:
                                     )
 
                                 # Display results in a beautiful table
-                                df = pd.DataFrame(results)
+                                df = results_to_frame(results)
                                 st.markdown("### 📊 Search Results")
                                 st.dataframe(df, use_container_width=True)
 
@@ -657,11 +1319,11 @@ def main() -> None:
                                 col1, col2 = st.columns(2)
 
                                 with col1:
-                                    # Enhanced download button
-                                    csv = df.to_csv(index=False)
+                                    # Enhanced download button; the CSV is only
+                                    # built when the button is clicked
                                     st.download_button(
                                         label="📥 Download Results as CSV",
-                                        data=csv,
+                                        data=partial(results_to_csv, results),
                                         file_name=f"auction_results_{keyword}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                                         mime="text/csv",
                                         use_container_width=True,
@@ -674,7 +1336,7 @@ def main() -> None:
                                         use_container_width=True,
                                     ):
                                         try:
-                                            client = get_gspread_client(
+                                            client = _cached_gspread_client(
                                                 service_account_path
                                             )
                                             write_results(
@@ -696,14 +1358,10 @@ def main() -> None:
                                             )
                             else:
                                 st.session_state.stats["failed_searches"] += 1
-                                st.markdown(
-                                    f"""
-                                    <div class="warning-message">
-                                        <h4 style="margin: 0;">⚠️ No Results Found</h4>
-                                        <p style="margin: 0.5rem 0 0 0;">No results found for '{keyword}'</p>
-                                    </div>
-                                    """,
-                                    unsafe_allow_html=True,
+                                show_message(
+                                    "warning",
+                                    "⚠️ No Results Found",
+                                    f"No results found for '{keyword}'",
                                 )
                                 log_message(
                                     f"No results found for keyword: {keyword}",
@@ -712,15 +1370,7 @@ def main() -> None:
 
                         except Exception as e:
                             st.session_state.stats["failed_searches"] += 1
-                            st.markdown(
-                                f"""
-                                <div class="error-message">
-                                    <h4 style="margin: 0;">❌ Search Failed</h4>
-                                    <p style="margin: 0.5rem 0 0 0;">{str(e)}</p>
-                                </div>
-                                """,
-                                unsafe_allow_html=True,
-                            )
+                            show_message("error", "❌ Search Failed", str(e))
                             log_message(
                                 f"Search failed for keyword {keyword}: {str(e)}",
                                 "ERROR",
@@ -739,25 +1389,7 @@ def main() -> None:
                 unsafe_allow_html=True,
             )
 
-            if st.session_state.results_data:
-                st.metric("Total Results", len(st.session_state.results_data))
-
-                # Calculate average price if available
-                prices = []
-                for result in st.session_state.results_data:
-                    price = result.get("Current price", "")
-                    if price and price != "N/A":
-                        try:
-                            numeric_price = extract_price(price)
-                            if numeric_price:
-                                prices.append(numeric_price)
-                        except:
-                            pass
-
-                if prices:
-                    avg_price = sum(prices) / len(prices)
-                    st.metric("Average Price", f"${avg_price:.2f}")
-                    st.metric("Price Range", f"${min(prices):.2f} - ${max(prices):.2f}")
+            quick_stats_panel()
 
     with tab2:
         st.markdown(
@@ -790,29 +1422,21 @@ def main() -> None:
                 st.session_state.processing_status = "batch_processing"
 
                 try:
-                    client = get_gspread_client(service_account_path)
-                    keywords = read_keywords(sheet_id, client)
+                    client = _cached_gspread_client(service_account_path)
+                    keywords = _cached_read_keywords(sheet_id, client)
 
                     if not keywords:
-                        st.markdown(
-                            """
-                            <div class="warning-message">
-                                <h4 style="margin: 0;">⚠️ No Keywords Found</h4>
-                                <p style="margin: 0.5rem 0 0 0;">No keywords found in the sheet!</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
+                        show_message(
+                            "warning",
+                            "⚠️ No Keywords Found",
+                            "No keywords found in the sheet!",
                         )
                         return
 
-                    st.markdown(
-                        f"""
-                        <div class="info-message">
-                            <h4 style="margin: 0;">📋 Processing Started</h4>
-                            <p style="margin: 0.5rem 0 0 0;">Processing {len(keywords)} keywords...</p>
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
+                    show_message(
+                        "info",
+                        "📋 Processing Started",
+                        f"Processing {len(keywords)} keywords...",
                     )
 
                     # Enhanced progress tracking
@@ -822,89 +1446,79 @@ def main() -> None:
 
                     total_results = 0
                     successful_keywords = 0
-                    search_cards = []
-
-                    for i, keyword in enumerate(keywords):
-                        status_text.text(f"🔍 Processing: {keyword}")
-
-                        try:
-                            results = scrape_auction_results(keyword, max_results)
-
-                            if results:
-                                write_results(sheet_id, keyword, results, client)
-                                total_results += len(results)
-                                successful_keywords += 1
-                                st.session_state.stats["total_results"] += len(results)
-                                st.session_state.stats["successful_searches"] += 1
-
-                                # Calculate average price for this keyword
-                                prices = []
-                                for result in results:
-                                    price = result.get("Current price", "")
-                                    if price and price != "N/A":
-                                        try:
-                                            numeric_price = extract_price(price)
-                                            if numeric_price:
-                                                prices.append(numeric_price)
-                                        except:
-                                            pass
-
-                                avg_price = (
-                                    sum(prices) / len(prices) if prices else None
-                                )
-                                search_cards.append(
-                                    create_search_card(keyword, len(results), avg_price)
-                                )
+                    failed_keywords = 0
+                    keyword_frames = []
+                    # Results are written to Sheets and the database in
+                    # batches on a background thread while scraping continues
+                    writer = BatchResultWriter(sheet_id, client, get_database())
+
+                    status_text.text(f"🔍 Processing {len(keywords)} keywords...")
+                    completed = scrape_keywords_concurrently(keywords, max_results)
+                    # Refresh the progress display at most ~20 times per batch
+                    update_every = max(1, len(keywords) // 20)
+
+                    try:
+                        for i, (keyword, future) in enumerate(completed):
+                            try:
+                                results = future.result()
 
-                                # Save to database
-                                try:
-                                    db = get_database()
-                                    inserted_count = db.insert_auction_results(
-                                        keyword, results
+                                if results:
+                                    writer.put(keyword, results)
+                                    total_results += len(results)
+                                    successful_keywords += 1
+
+                                    # Summarized per keyword after the loop
+                                    keyword_frames.append(
+                                        results_to_frame(results).assign(
+                                            Keyword=keyword
+                                        )
                                     )
+
                                     log_message(
-                                        f"Saved {inserted_count} results to database for keyword: {keyword}"
+                                        f"Processed keyword '{keyword}': {len(results)} results"
                                     )
-                                except Exception as e:
+                                else:
+                                    failed_keywords += 1
                                     log_message(
-                                        f"Database save failed for keyword {keyword}: {str(e)}",
-                                        "WARNING",
+                                        f"No results for keyword '{keyword}'", "WARNING"
                                     )
 
+                            except Exception as e:
+                                failed_keywords += 1
                                 log_message(
-                                    f"Processed keyword '{keyword}': {len(results)} results"
-                                )
-                            else:
-                                st.session_state.stats["failed_searches"] += 1
-                                log_message(
-                                    f"No results for keyword '{keyword}'", "WARNING"
+                                    f"Error processing keyword '{keyword}': {str(e)}",
+                                    "ERROR",
                                 )
 
-                        except Exception as e:
-                            st.session_state.stats["failed_searches"] += 1
-                            log_message(
-                                f"Error processing keyword '{keyword}': {str(e)}",
-                                "ERROR",
-                            )
-
-                        # Update progress
-                        progress = (i + 1) / len(keywords)
-                        progress_bar.progress(progress)
-                        time.sleep(0.1)
+                            # Update progress
+                            done = i + 1
+                            if done % update_every == 0 or done == len(keywords):
+                                status_text.text(f"🔍 Finished: {keyword}")
+                                progress_bar.progress(done / len(keywords))
+                    finally:
+                        completed.close()
+                        saved_count, write_errors = writer.close()
+                        record_search_stats(
+                            successful_keywords, failed_keywords, total_results
+                        )
 
                     progress_bar.empty()
                     status_text.empty()
+                    search_cards = summary_cards(keyword_frames)
+
+                    for error in write_errors:
+                        st.warning(f"⚠️ {error}")
+                        log_message(error, "WARNING")
+                    log_message(
+                        f"Saved {saved_count} results to database for {successful_keywords} keywords"
+                    )
 
                     # Display results summary
                     with results_container:
-                        st.markdown(
-                            f"""
-                            <div class="success-message">
-                                <h4 style="margin: 0;">✅ Batch Processing Complete!</h4>
-                                <p style="margin: 0.5rem 0 0 0;">Successfully processed {successful_keywords} keywords with {total_results} total results</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
+                        show_message(
+                            "success",
+                            "✅ Batch Processing Complete!",
+                            f"Successfully processed {successful_keywords} keywords with {total_results} total results",
                         )
 
                         # Display search cards
@@ -925,15 +1539,7 @@ def main() -> None:
                             )
 
                 except Exception as e:
-                    st.markdown(
-                        f"""
-                        <div class="error-message">
-                            <h4 style="margin: 0;">❌ Batch Processing Failed</h4>
-                            <p style="margin: 0.5rem 0 0 0;">{str(e)}</p>
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
-                    )
+                    show_message("error", "❌ Batch Processing Failed", str(e))
                     log_message(f"Batch processing failed: {str(e)}", "ERROR")
 
                 st.session_state.processing_status = "idle"
@@ -966,87 +1572,84 @@ def main() -> None:
                     ]
 
                     if keywords_list:
-                        st.markdown(
-                            f"""
-                            <div class="info-message">
-                                <h4 style="margin: 0;">📋 Manual Processing</h4>
-                                <p style="margin: 0.5rem 0 0 0;">Processing {len(keywords_list)} manual keywords...</p>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
+                        show_message(
+                            "info",
+                            "📋 Manual Processing",
+                            f"Processing {len(keywords_list)} manual keywords...",
                         )
 
                         progress_bar = st.progress(0)
                         status_text = st.empty()
 
                         all_results = []
-                        search_cards = []
+                        keyword_frames = []
+                        successful_keywords = 0
+                        failed_keywords = 0
 
-                        for i, keyword in enumerate(keywords_list):
-                            status_text.text(f"🔍 Processing: {keyword}")
+                        status_text.text(
+                            f"🔍 Processing {len(keywords_list)} keywords..."
+                        )
+                        completed = scrape_keywords_concurrently(
+                            keywords_list, max_results
+                        )
+                        # Refresh the progress display at most ~20 times
+                        update_every = max(1, len(keywords_list) // 20)
 
-                            try:
-                                results = scrape_auction_results(keyword, max_results)
-                                if results:
-                                    all_results.extend(results)
-                                    st.session_state.stats["total_results"] += len(
-                                        results
-                                    )
-                                    st.session_state.stats["successful_searches"] += 1
-
-                                    # Calculate average price for this keyword
-                                    prices = []
-                                    for result in results:
-                                        price = result.get("Current price", "")
-                                        if price and price != "N/A":
-                                            try:
-                                                numeric_price = extract_price(price)
-                                                if numeric_price:
-                                                    prices.append(numeric_price)
-                                            except:
-                                                pass
-
-                                    avg_price = (
-                                        sum(prices) / len(prices) if prices else None
-                                    )
-                                    search_cards.append(
-                                        create_search_card(
-                                            keyword, len(results), avg_price
+                        try:
+                            for i, (keyword, future) in enumerate(completed):
+                                try:
+                                    results = future.result()
+                                    if results:
+                                        all_results.extend(results)
+                                        successful_keywords += 1
+
+                                        # Summarized per keyword after the loop
+                                        keyword_frames.append(
+                                            results_to_frame(results).assign(
+                                                Keyword=keyword
+                                            )
                                         )
-                                    )
 
+                                        log_message(
+                                            f"Processed keyword '{keyword}': {len(results)} results"
+                                        )
+                                    else:
+                                        failed_keywords += 1
+                                        log_message(
+                                            f"No results for keyword '{keyword}'", "WARNING"
+                                        )
+                                except Exception as e:
+                                    failed_keywords += 1
                                     log_message(
-                                        f"Processed keyword '{keyword}': {len(results)} results"
-                                    )
-                                else:
-                                    st.session_state.stats["failed_searches"] += 1
-                                    log_message(
-                                        f"No results for keyword '{keyword}'", "WARNING"
+                                        f"Error processing keyword '{keyword}': {str(e)}",
+                                        "ERROR",
                                     )
-                            except Exception as e:
-                                st.session_state.stats["failed_searches"] += 1
-                                log_message(
-                                    f"Error processing keyword '{keyword}': {str(e)}",
-                                    "ERROR",
-                                )
 
-                            progress = (i + 1) / len(keywords_list)
-                            progress_bar.progress(progress)
-                            time.sleep(0.1)
+                                done = i + 1
+                                if (
+                                    done % update_every == 0
+                                    or done == len(keywords_list)
+                                ):
+                                    status_text.text(f"🔍 Finished: {keyword}")
+                                    progress_bar.progress(done / len(keywords_list))
+                        finally:
+                            completed.close()
 
                         progress_bar.empty()
                         status_text.empty()
+                        record_search_stats(
+                            successful_keywords, failed_keywords, len(all_results)
+                        )
+                        search_cards = summary_cards(keyword_frames)
 
                         if all_results:
-                            st.session_state.results_data = all_results
-                            st.markdown(
-                                f"""
-                                <div class="success-message">
-                                    <h4 style="margin: 0;">✅ Manual Processing Complete!</h4>
-                                    <p style="margin: 0.5rem 0 0 0;">Found {len(all_results)} total results</p>
-                                </div>
-                                """,
-                                unsafe_allow_html=True,
+                            st.session_state.results_df = results_to_frame(
+                                all_results
+                            )
+                            show_message(
+                                "success",
+                                "✅ Manual Processing Complete!",
+                                f"Found {len(all_results)} total results",
                             )
 
                             # Display search cards
@@ -1055,340 +1658,30 @@ def main() -> None:
                                 for card in search_cards:
                                     st.markdown(card, unsafe_allow_html=True)
 
-                            # Enhanced download button
-                            df = pd.DataFrame(all_results)
-                            csv = df.to_csv(index=False)
+                            # Enhanced download button; the CSV is only built
+                            # when the button is clicked
                             st.download_button(
                                 label="📥 Download All Results",
-                                data=csv,
+                                data=partial(results_to_csv, all_results),
                                 file_name=f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                                 mime="text/csv",
                                 use_container_width=True,
                             )
                         else:
-                            st.markdown(
-                                """
-                                <div class="warning-message">
-                                    <h4 style="margin: 0;">⚠️ No Results Found</h4>
-                                    <p style="margin: 0.5rem 0 0 0;">No results found for any keywords</p>
-                                </div>
-                                """,
-                                unsafe_allow_html=True,
+                            show_message(
+                                "warning",
+                                "⚠️ No Results Found",
+                                "No results found for any keywords",
                             )
 
     with tab3:
-        st.markdown(
-            """
-            <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 15px; 
-                        box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 2rem;">
-                <h2 style="margin: 0 0 1rem 0; color: #333;">📊 Results Viewer</h2>
-                <p style="margin: 0; color: #666;">View and analyze your scraped auction data</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-        if st.session_state.results_data:
-            st.markdown(
-                f"""
-                <div class="info-message">
-                    <h4 style="margin: 0;">📊 Current Results</h4>
-                    <p style="margin: 0.5rem 0 0 0;">{len(st.session_state.results_data)} items available for analysis</p>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-
-            # Enhanced filter options
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                price_filter = st.selectbox(
-                    "Filter by Price",
-                    ["All", "Under $50", "$50-$100", "$100-$500", "Over $500"],
-                )
-
-            with col2:
-                search_filter = st.text_input("Search in descriptions", "")
-
-            # Apply filters
-            filtered_results = st.session_state.results_data.copy()
-
-            if price_filter != "All":
-                # Apply price filtering logic here
-                pass
-
-            if search_filter:
-                filtered_results = [
-                    result
-                    for result in filtered_results
-                    if search_filter.lower()
-                    in result.get("Item Description", "").lower()
-                ]
-
-            # Display filtered results
-            if filtered_results:
-                df = pd.DataFrame(filtered_results)
-                st.markdown("### 📋 Filtered Results")
-                st.dataframe(df, use_container_width=True)
-
-                # Enhanced summary statistics
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Total Items", len(filtered_results))
-                with col2:
-                    st.metric(
-                        "Unique Keywords",
-                        len(
-                            set(
-                                result.get("Keyword", "") for result in filtered_results
-                            )
-                        ),
-                    )
-                with col3:
-                    # Calculate average price
-                    prices = []
-                    for result in filtered_results:
-                        price = result.get("Current price", "")
-                        if price and price != "N/A":
-                            try:
-                                numeric_price = extract_price(price)
-                                if numeric_price:
-                                    prices.append(numeric_price)
-                            except:
-                                pass
-
-                    avg_price = f"${sum(prices) / len(prices):.2f}" if prices else "N/A"
-                    st.metric("Average Price", avg_price)
-                with col4:
-                    st.metric("Filtered Items", len(filtered_results))
-            else:
-                st.markdown(
-                    """
-                    <div class="warning-message">
-                        <h4 style="margin: 0;">⚠️ No Matching Results</h4>
-                        <p style="margin: 0.5rem 0 0 0;">No results match the current filters</p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-        else:
-            st.markdown(
-                """
-                <div class="info-message">
-                    <h4 style="margin: 0;">📊 No Results Available</h4>
-                    <p style="margin: 0.5rem 0 0 0;">Run a search first to see results here!</p>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+        results_viewer_tab()
 
     with tab4:
-        st.markdown(
-            """
-            <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 15px; 
-                        box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 2rem;">
-                <h2 style="margin: 0 0 1rem 0; color: #333;">🦆 Database Analytics</h2>
-                <p style="margin: 0; color: #666;">Analyze stored auction data and generate insights</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-        try:
-            db = get_database()
-
-            # Database Overview
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                stats = db.get_database_stats()
-                st.metric("Total Records", stats.get("total_records", 0))
-
-            with col2:
-                st.metric("Unique Keywords", stats.get("unique_keywords", 0))
-
-            with col3:
-                avg_price = stats.get("avg_price", 0)
-                st.metric("Avg Price", f"${avg_price:.2f}" if avg_price else "N/A")
-
-            with col4:
-                median_price = stats.get("median_price", 0)
-                st.metric(
-                    "Median Price", f"${median_price:.2f}" if median_price else "N/A"
-                )
-
-            # Analytics Sections
-            col1, col2 = st.columns([2, 1])
-
-            with col1:
-                st.subheader("📊 Keyword Statistics")
-                keyword_stats = db.get_keyword_stats()
-                if not keyword_stats.empty:
-                    st.dataframe(keyword_stats, use_container_width=True)
-                else:
-                    st.info(
-                        "No keyword data available yet. Run some searches to populate the database."
-                    )
-
-            with col2:
-                st.subheader("🔍 Quick Search")
-                search_term = st.text_input("Search items by description")
-                if search_term:
-                    results = db.search_items(search_term, limit=10)
-                    if not results.empty:
-                        st.dataframe(
-                            results[["keyword", "item_description", "current_price"]],
-                            use_container_width=True,
-                        )
-                    else:
-                        st.info("No items found matching your search.")
-
-            # Price Analytics
-            st.subheader("💰 Price Analytics")
-            price_stats = db.get_price_analytics()
-
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Min Price", f"${price_stats.get('min_price', 0):.2f}")
-            with col2:
-                st.metric("Max Price", f"${price_stats.get('max_price', 0):.2f}")
-            with col3:
-                st.metric("Total Items", price_stats.get("total_items", 0))
-
-            # Recent Activity
-            st.subheader("⏰ Recent Activity")
-            hours = st.slider("Hours to look back", 1, 168, 24)
-            recent_results = db.get_recent_results(hours)
-
-            if not recent_results.empty:
-                st.dataframe(
-                    recent_results[
-                        ["keyword", "item_description", "current_price", "scraped_at"]
-                    ],
-                    use_container_width=True,
-                )
-            else:
-                st.info(f"No activity in the last {hours} hours.")
-
-            # Export Options
-            st.subheader("📤 Export Data")
-            col1, col2 = st.columns(2)
-
-            with col1:
-                if st.button("Export All Data to CSV"):
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"auction_data_export_{timestamp}.csv"
-                    db.export_to_csv(filename)
-                    st.success(f"Data exported to {filename}")
-
-            with col2:
-                keyword_filter = st.text_input("Filter by keyword for export")
-                if keyword_filter and st.button("Export Filtered Data"):
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"auction_data_{keyword_filter}_{timestamp}.csv"
-                    db.export_to_csv(filename, keyword=keyword_filter)
-                    st.success(f"Filtered data exported to {filename}")
-
-        except Exception as e:
-            st.error(f"Database error: {str(e)}")
-            st.info("Make sure DuckDB is installed: pip install duckdb")
+        database_analytics_tab()
 
     with tab5:
-        st.markdown(
-            """
-            <div style="background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 15px; 
-                        box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 2rem;">
-                <h2 style="margin: 0 0 1rem 0; color: #333;">🛠️ Utilities</h2>
-                <p style="margin: 0; color: #666;">Test and validate data processing functions</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown(
-                """
-                <div style="background: rgba(255, 255, 255, 0.95); padding: 1.5rem; border-radius: 15px; 
-                            box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 1rem;">
-                    <h3 style="margin: 0 0 1rem 0; color: #333;">🧹 Text Processing</h3>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-
-            test_text = st.text_input(
-                "Test text cleaning", "  This   is   dirty   text  "
-            )
-            if st.button("Clean Text", use_container_width=True):
-                cleaned = clean_text(test_text)
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <h4 style="margin: 0 0 0.5rem 0; color: #333;">Text Cleaning Results</h4>
-                        <p style="margin: 0; color: #666;"><strong>Original:</strong> <code>{test_text}</code></p>
-                        <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Cleaned:</strong> <code>{cleaned}</code></p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-
-            test_keyword = st.text_input(
-                "Test keyword sanitization", "  Gore-Tex  Jacket  "
-            )
-            if st.button("Sanitize Keyword", use_container_width=True):
-                sanitized = sanitize_keyword(test_keyword)
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <h4 style="margin: 0 0 0.5rem 0; color: #333;">Keyword Sanitization Results</h4>
-                        <p style="margin: 0; color: #666;"><strong>Original:</strong> <code>{test_keyword}</code></p>
-                        <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Sanitized:</strong> <code>{sanitized}</code></p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-
-        with col2:
-            st.markdown(
-                """
-                <div style="background: rgba(255, 255, 255, 0.95); padding: 1.5rem; border-radius: 15px; 
-                            box-shadow: 0 8px 32px rgba(0,0,0,0.1); margin-bottom: 1rem;">
-                    <h3 style="margin: 0 0 1rem 0; color: #333;">✅ Data Validation</h3>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-
-            test_price = st.text_input("Test price extraction", "$123.45")
-            if st.button("Extract Price", use_container_width=True):
-                extracted = extract_price(test_price)
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <h4 style="margin: 0 0 0.5rem 0; color: #333;">Price Extraction Results</h4>
-                        <p style="margin: 0; color: #666;"><strong>Input:</strong> <code>{test_price}</code></p>
-                        <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Extracted:</strong> <code>{extracted}</code></p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-
-            test_date = st.text_input("Test date formatting", "  Dec 15, 2024  ")
-            if st.button("Format Date", use_container_width=True):
-                formatted = format_date(test_date)
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <h4 style="margin: 0 0 0.5rem 0; color: #333;">Date Formatting Results</h4>
-                        <p style="margin: 0; color: #666;"><strong>Input:</strong> <code>{test_date}</code></p>
-                        <p style="margin: 0.5rem 0 0 0; color: #666;"><strong>Formatted:</strong> <code>{formatted}</code></p>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+        utilities_tab()
 
     # Display logs at the bottom with enhanced styling
     display_logs()